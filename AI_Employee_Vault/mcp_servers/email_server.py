@@ -23,15 +23,44 @@ SETUP REQUIRED:
 2. Enable Gmail API or use App Passwords
 """
 
+import io
 import os
+import re
+import sys
 import json
+import base64
+import queue
+import asyncio
+import atexit
+import itertools
 import smtplib
 import logging
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from email.generator import BytesGenerator
+from email.message import EmailMessage
+from email.policy import SMTP as SMTP_BASE_POLICY
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+
+try:
+    import aiosmtplib
+    AIOSMTPLIB_AVAILABLE = True
+except ImportError:
+    AIOSMTPLIB_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Vault markdown helpers shared with the watchers
+WATCHERS_PATH = Path(__file__).resolve().parent.parent / 'watchers'
+if str(WATCHERS_PATH) not in sys.path:
+    sys.path.insert(0, str(WATCHERS_PATH))
+import frontmatter_util
 
 # Configure logging
 logging.basicConfig(
@@ -40,6 +69,333 @@ logging.basicConfig(
 )
 logger = logging.getLogger('MCP_EmailServer')
 
+# Gmail SMTP settings
+SMTP_HOST = 'smtp.gmail.com'
+SMTP_PORT = 465
+MAX_POOL_CONNECTIONS = 5  # Parallel SMTP connections per account
+MAX_MESSAGES_PER_CONNECTION = 100  # Recycle a connection to respect provider limits
+
+# Fixed MIME headers for the single-part message sent by send_email
+MIME_HEADERS_TEMPLATE = (
+    'MIME-Version: 1.0\r\n'
+    'Content-Type: text/{subtype}; charset="{charset}"\r\n'
+    'Content-Transfer-Encoding: {encoding}\r\n'
+    '\r\n'
+)
+# Policy for the email-package fallback: CRLF line endings, 7bit-safe transfer
+# encodings, no refolding of headers that were not created here
+SMTP_POLICY = SMTP_BASE_POLICY.clone(cte_type='7bit', refold_source='none')
+HTML_TAG_RE = re.compile(r'<[a-zA-Z][^>]*>')
+MAX_LINE_LENGTH = 998  # RFC 5322 line limit
+
+DAILY_LOG_FLUSH_EVERY = 10  # Flush the buffered daily log after this many entries
+EMAIL_LOG_FILE = 'emails.jsonl'  # Append-only per-email audit log in Logs/Email
+DRAFT_HEADER_BYTES = 1024  # list_drafts only reads this much of each draft (the frontmatter)
+DRAFT_FRONTMATTER_RE = re.compile(rb'^(to|subject|created):(.*)$', re.MULTILINE)
+BATCH_ABORT_MIN_SIZE = 30  # send_batch aborts once a third of a batch this size fails
+BATCH_REQUIRED_KEYS = frozenset({'to', 'subject', 'body'})  # Keys every send_batch item needs
+BATCH_ALLOWED_KEYS = BATCH_REQUIRED_KEYS | {'reply_to'}
+
+# Daily markdown log entry, formatted once per send
+DAILY_LOG_ENTRY = (
+    "\n## Email {email_id}\n"
+    "- **Time:** {time}\n"
+    "- **To:** {to}\n"
+    "- **Subject:** {subject}\n"
+    "- **Status:** {status}\n"
+    "{error}"
+    "\n"
+)
+DAILY_LOG_ERROR = "- **Error:** {error}\n"
+
+AUTH_ERRORS = (smtplib.SMTPAuthenticationError,)
+if AIOSMTPLIB_AVAILABLE:
+    AUTH_ERRORS += (aiosmtplib.SMTPAuthenticationError,)
+
+
+class _PooledConnection:
+    """An authenticated SMTP connection plus the number of messages sent on it."""
+
+    def __init__(self, smtp: smtplib.SMTP_SSL):
+        self.smtp = smtp
+        self.sent = 0
+
+    def is_alive(self) -> bool:
+        try:
+            return self.smtp.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def close(self):
+        try:
+            self.smtp.quit()
+        except Exception:
+            self.smtp.close()
+
+
+class SMTPConnectionPool:
+    """
+    Bounded pool of authenticated SMTP connections for one account.
+
+    Connections are created on demand up to max_connections; acquire()
+    blocks when all of them are in use. Idle connections are health-checked
+    with NOOP before reuse and recycled after max_messages sends.
+    """
+
+    def __init__(self, host: str, port: int, user: str, password: str,
+                 max_connections: int = MAX_POOL_CONNECTIONS,
+                 max_messages: int = MAX_MESSAGES_PER_CONNECTION):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.max_messages = max_messages
+        self._idle = queue.Queue(maxsize=max_connections)
+        self._slots = threading.BoundedSemaphore(max_connections)
+
+    def _connect(self) -> _PooledConnection:
+        smtp = smtplib.SMTP_SSL(self.host, self.port)
+        try:
+            smtp.login(self.user, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        return _PooledConnection(smtp)
+
+    def acquire(self) -> _PooledConnection:
+        """Borrow a live connection, opening a new one if none is idle."""
+        self._slots.acquire()
+        try:
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._connect()
+                if conn.sent < self.max_messages and conn.is_alive():
+                    return conn
+                conn.close()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, conn: _PooledConnection, discard: bool = False):
+        """Return a connection to the pool (or close it when discard=True)."""
+        try:
+            if discard or conn.sent >= self.max_messages:
+                conn.close()
+            else:
+                self._idle.put_nowait(conn)
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """Close all idle connections."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+
+
+# Sequence number keeps email/draft IDs unique when several are created in the
+# same second (shared by all EmailServer instances in the process)
+_id_sequence = itertools.count()
+
+# Pools are shared per (host, user) so several EmailServer instances reuse connections
+_pools: Dict[Tuple[str, str], SMTPConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_smtp_pool(user: str, password: str, host: str = SMTP_HOST,
+                  port: int = SMTP_PORT) -> SMTPConnectionPool:
+    """Return the shared connection pool for an account, creating it if needed."""
+    key = (host, user)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = SMTPConnectionPool(host, port, user, password)
+            _pools[key] = pool
+        return pool
+
+
+def _is_plain_header(value: str) -> bool:
+    """True if a header value can be written as-is (ASCII, single line, not overlong)."""
+    return (value.isascii() and '\r' not in value and '\n' not in value
+            and len(value) < MAX_LINE_LENGTH - 20)
+
+
+def _is_html(body: str) -> bool:
+    """True if the body contains at least one HTML tag."""
+    return HTML_TAG_RE.search(body) is not None
+
+
+def _encode_body(body: str) -> Tuple[str, str, str]:
+    """
+    Return (charset, transfer encoding, payload) for a message body.
+
+    A 7bit body only has its line endings changed to CRLF; anything else
+    (non-ASCII, over-long lines, a bare CR) goes out as base64.
+    """
+    text = body.replace('\r\n', '\n')
+    lines = text.split('\n')
+    if text.isascii() and '\r' not in text and all(len(line) <= MAX_LINE_LENGTH for line in lines):
+        return 'us-ascii', '7bit', '\r\n'.join(lines)
+    encoded = base64.encodebytes(body.encode('utf-8')).decode('ascii')
+    return 'utf-8', 'base64', encoded.rstrip('\n').replace('\n', '\r\n')
+
+
+def _dump_json(data: Dict[str, Any]) -> bytes:
+    """Serialize a log record as one line of JSON bytes (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def _load_json(data: bytes) -> Dict[str, Any]:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _log_io_error(future: Future):
+    error = future.exception()
+    if error is not None:
+        logger.error(f"Failed to write email file: {error}")
+
+
+async def _quit_async_smtp(smtp):
+    """Politely end an aiosmtplib session, closing the socket if QUIT fails."""
+    try:
+        await smtp.quit()
+    except Exception:
+        smtp.close()
+
+
+@atexit.register
+def _close_smtp_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+
+
+# MCP tool definitions - tells Claude what tools are available and how to use them
+TOOL_DEFINITIONS = [
+    {
+        "name": "send_email",
+        "description": "Send an email that has been approved. Only use after human approval.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "to": {
+                    "type": "string",
+                    "description": "Recipient email address"
+                },
+                "subject": {
+                    "type": "string",
+                    "description": "Email subject line"
+                },
+                "body": {
+                    "type": "string",
+                    "description": "Email body content (can include HTML)"
+                },
+                "reply_to": {
+                    "type": "string",
+                    "description": "Optional reply-to address"
+                }
+            },
+            "required": ["to", "subject", "body"]
+        }
+    },
+    {
+        "name": "send_batch",
+        "description": "Send a list of approved emails in one batch. Stops early if too many fail. Only use after human approval.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "emails": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "to": {"type": "string"},
+                            "subject": {"type": "string"},
+                            "body": {"type": "string"},
+                            "reply_to": {"type": "string"}
+                        },
+                        "required": ["to", "subject", "body"]
+                    },
+                    "description": "Emails to send"
+                }
+            },
+            "required": ["emails"]
+        }
+    },
+    {
+        "name": "flush_drafts",
+        "description": "Send several approved drafts in parallel. Only use after human approval.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "draft_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "IDs of drafts that have been moved to /Approved"
+                }
+            },
+            "required": ["draft_ids"]
+        }
+    },
+    {
+        "name": "draft_email",
+        "description": "Create an email draft for human approval. Does NOT send the email.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "to": {
+                    "type": "string",
+                    "description": "Recipient email address"
+                },
+                "subject": {
+                    "type": "string",
+                    "description": "Email subject line"
+                },
+                "body": {
+                    "type": "string",
+                    "description": "Email body content"
+                },
+                "context": {
+                    "type": "string",
+                    "description": "Why this email is being sent (for human reviewer)"
+                }
+            },
+            "required": ["to", "subject", "body"]
+        }
+    },
+    {
+        "name": "list_drafts",
+        "description": "List all email drafts pending approval",
+        "parameters": {
+            "type": "object",
+            "properties": {}
+        }
+    },
+    {
+        "name": "get_email_status",
+        "description": "Check if an email was sent successfully",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "email_id": {
+                    "type": "string",
+                    "description": "The email ID to check"
+                }
+            },
+            "required": ["email_id"]
+        }
+    }
+]
+
 
 class EmailServer:
     """
@@ -53,22 +409,78 @@ class EmailServer:
         self.vault_path = Path(vault_path)
         self.logs_folder = self.vault_path / 'Logs' / 'Email'
         self.logs_folder.mkdir(parents=True, exist_ok=True)
+        self.approval_folder = self.vault_path / 'Pending_Approval'
+        self.approval_folder.mkdir(parents=True, exist_ok=True)
+        self.approved_folder = self.vault_path / 'Approved'
+        self.done_folder = self.vault_path / 'Done'
+
+        # Per-email audit records live in one append-only JSONL file,
+        # indexed in memory by email_id -> (offset, length)
+        self._email_log_lock = threading.Lock()
+        self._email_log_fp = None
+        self._email_offsets = self._index_email_log()
 
         # Email configuration from environment
         self.email_user = os.getenv('EMAIL_USER')
         self.email_pass = os.getenv('EMAIL_PASS', '').replace(' ', '')  # Remove spaces from app password
 
-        if not self.email_user or not self.email_pass:
+        # Credentials are validated once here rather than on every send
+        self._creds_ok = bool(self.email_user and self.email_pass)
+        self._creds = (self.email_user, self.email_pass) if self._creds_ok else None
+
+        if not self._creds_ok:
             logger.warning("EMAIL_USER or EMAIL_PASS not set. Email sending will fail.")
 
+        # From header is the same for every message
+        self._from_header = None
+        if self.email_user and _is_plain_header(self.email_user):
+            self._from_header = f"From: {self.email_user}\r\n"
+
+        # Shared SMTP connection pool (connections are opened lazily)
+        self._pool = None
+        if self._creds_ok:
+            self._pool = get_smtp_pool(*self._creds)
+
+        # Idle aiosmtplib connections for send_email_async as (connection,
+        # messages sent), and the limit on open ones; both are bound to the
+        # event loop that made them
+        self._async_idle = []
+        self._async_slots = None
+        self._async_loop = None
+
+        # Parsed draft frontmatter keyed by file name: {name: (mtime, info)}
+        self._draft_cache: Dict[str, Tuple[float, Dict[str, str]]] = {}
+        self._draft_files: List[Tuple[str, str]] = []
+        self._drafts_dir_mtime = None
+
+        # Daily markdown log is kept open and buffered between sends
+        self._daily_log_fp = None
+        self._daily_log_day = None
+        self._daily_log_pending = 0
+        self._daily_log_lock = threading.Lock()
+
+        # Log and draft files are written off the request path by a single writer thread
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='email-io')
+        self._pending_io = []
+        self._pending_io_lock = threading.Lock()
+        atexit.register(self._close_logs)
+
         # Define available tools for MCP
         self.tools = {
             'send_email': self.send_email,
+            'send_batch': self.send_batch,
+            'flush_drafts': self.flush_drafts,
             'draft_email': self.draft_email,
             'list_drafts': self.list_drafts,
             'get_email_status': self.get_email_status
         }
 
+        # Dispatch table: tool name -> (bound method, required argument names)
+        self._dispatch = {
+            tool['name']: (self.tools[tool['name']], frozenset(tool['parameters'].get('required', ())))
+            for tool in TOOL_DEFINITIONS
+        }
+
         logger.info(f"Email Server initialized for vault: {vault_path}")
 
     def get_tool_definitions(self) -> list:
@@ -76,82 +488,7 @@ class EmailServer:
         Return MCP tool definitions for Claude.
         This tells Claude what tools are available and how to use them.
         """
-        return [
-            {
-                "name": "send_email",
-                "description": "Send an email that has been approved. Only use after human approval.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "to": {
-                            "type": "string",
-                            "description": "Recipient email address"
-                        },
-                        "subject": {
-                            "type": "string",
-                            "description": "Email subject line"
-                        },
-                        "body": {
-                            "type": "string",
-                            "description": "Email body content (can include HTML)"
-                        },
-                        "reply_to": {
-                            "type": "string",
-                            "description": "Optional reply-to address"
-                        }
-                    },
-                    "required": ["to", "subject", "body"]
-                }
-            },
-            {
-                "name": "draft_email",
-                "description": "Create an email draft for human approval. Does NOT send the email.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "to": {
-                            "type": "string",
-                            "description": "Recipient email address"
-                        },
-                        "subject": {
-                            "type": "string",
-                            "description": "Email subject line"
-                        },
-                        "body": {
-                            "type": "string",
-                            "description": "Email body content"
-                        },
-                        "context": {
-                            "type": "string",
-                            "description": "Why this email is being sent (for human reviewer)"
-                        }
-                    },
-                    "required": ["to", "subject", "body"]
-                }
-            },
-            {
-                "name": "list_drafts",
-                "description": "List all email drafts pending approval",
-                "parameters": {
-                    "type": "object",
-                    "properties": {}
-                }
-            },
-            {
-                "name": "get_email_status",
-                "description": "Check if an email was sent successfully",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "email_id": {
-                            "type": "string",
-                            "description": "The email ID to check"
-                        }
-                    },
-                    "required": ["email_id"]
-                }
-            }
-        ]
+        return TOOL_DEFINITIONS
 
     def send_email(self, to: str, subject: str, body: str, reply_to: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -168,67 +505,404 @@ class EmailServer:
         Returns:
             Dict with success status and details
         """
-        email_id = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return self._send(to, subject, body, reply_to)
+
+    def send_batch(self, emails: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Send a list of approved emails one after another.
+
+        The daily log is written and fsynced once at the end instead of per
+        email. For batches of BATCH_ABORT_MIN_SIZE or more, sending stops
+        early once more than a third of the batch has failed (usually an
+        auth or rate-limit problem that retrying will not fix).
+
+        Args:
+            emails: List of send_email keyword argument dicts
+
+        Returns:
+            Dict with sent/failed counts, whether the batch was aborted and
+            the per-email results
+        """
+        daily_rows = []
+        results = []
+        failed = 0
+        aborted = False
 
         try:
-            # Validate email configuration
-            if not self.email_user or not self.email_pass:
-                return {
-                    "success": False,
-                    "error": "Email credentials not configured. Set EMAIL_USER and EMAIL_PASS environment variables.",
-                    "email_id": email_id
-                }
+            for email in emails:
+                error = self._batch_item_error(email)
+                if error is None:
+                    result = self._send(daily_rows=daily_rows, **email)
+                else:
+                    result = {"success": False, "error": error}
+                results.append(result)
+                if not result.get("success"):
+                    failed += 1
+                    if len(emails) >= BATCH_ABORT_MIN_SIZE and failed > len(emails) // 3:
+                        aborted = True
+                        logger.error(f"Aborting batch after {failed} failures out of {len(results)} sends")
+                        break
+        finally:
+            # Log whatever was sent, even if the batch stopped on an error
+            self._write_daily_log(daily_rows, fsync=True)
 
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['From'] = self.email_user
-            msg['To'] = to
-            msg['Subject'] = subject
+        return {
+            "success": failed == 0 and not aborted,
+            "sent": len(results) - failed,
+            "failed": failed,
+            "aborted": aborted,
+            "skipped": len(emails) - len(results),
+            "results": results
+        }
 
-            if reply_to:
-                msg['Reply-To'] = reply_to
+    @staticmethod
+    def _batch_item_error(email: Any) -> Optional[str]:
+        """Why a send_batch item can't be sent (None if it can)."""
+        if not isinstance(email, dict):
+            return "Batch item must be an object"
+        missing = BATCH_REQUIRED_KEYS - email.keys()
+        if missing:
+            return f"Missing fields: {', '.join(sorted(missing))}"
+        unexpected = email.keys() - BATCH_ALLOWED_KEYS
+        if unexpected:
+            return f"Unexpected fields: {', '.join(sorted(unexpected))}"
+        return None
+
+    def _send(self, to: str, subject: str, body: str, reply_to: Optional[str] = None,
+              daily_rows: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Send one email; daily log entries go to daily_rows when given."""
+        now = datetime.now()
+        email_id = self._new_id(now)
+
+        # Validate email configuration
+        if not self._creds_ok:
+            return self._missing_credentials(email_id)
 
-            # Add body (as both plain text and HTML)
-            text_part = MIMEText(body, 'plain')
-            html_part = MIMEText(body, 'html')
-            msg.attach(text_part)
-            msg.attach(html_part)
+        try:
+            msg = self._build_message(to, subject, body, reply_to)
 
-            # Send via Gmail SMTP
-            with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
-                server.login(self.email_user, self.email_pass)
-                server.sendmail(self.email_user, to, msg.as_string())
+            # Send via Gmail SMTP (reuses a pooled, authenticated connection)
+            self._sendmail(to, msg)
+        except Exception as e:
+            return self._send_failed(email_id, now, to, subject, body, e, daily_rows)
 
-            # Log the sent email
-            self._log_email(email_id, to, subject, body, status='sent')
+        return self._send_succeeded(email_id, now, to, subject, body, daily_rows)
 
-            logger.info(f"Email sent successfully to {to} (ID: {email_id})")
+    async def send_email_async(self, to: str, subject: str, body: str,
+                               reply_to: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Async variant of send_email for use inside an event loop.
 
-            return {
-                "success": True,
-                "message": f"Email sent successfully to {to}",
-                "email_id": email_id,
-                "timestamp": datetime.now().isoformat()
-            }
+        Uses aiosmtplib when installed so the loop keeps running while Gmail
+        responds; otherwise the blocking send runs in a worker thread.
+        """
+        if not AIOSMTPLIB_AVAILABLE:
+            return await asyncio.to_thread(self.send_email, to, subject, body, reply_to)
 
-        except smtplib.SMTPAuthenticationError as e:
-            logger.error(f"SMTP Authentication failed: {e}")
-            self._log_email(email_id, to, subject, body, status='failed', error=str(e))
-            return {
-                "success": False,
-                "error": "Authentication failed. Check EMAIL_USER and EMAIL_PASS (use App Password, not regular password).",
-                "email_id": email_id
-            }
+        now = datetime.now()
+        email_id = self._new_id(now)
+
+        if not self._creds_ok:
+            return self._missing_credentials(email_id)
 
+        try:
+            msg = self._build_message(to, subject, body, reply_to)
+            smtp, sent = await self._acquire_async_smtp()
+            try:
+                await smtp.sendmail(self.email_user, [to], msg)
+            except Exception:
+                await self._release_async_smtp(smtp, sent, discard=True)
+                raise
+            await self._release_async_smtp(smtp, sent + 1)
         except Exception as e:
-            logger.error(f"Failed to send email: {e}")
-            self._log_email(email_id, to, subject, body, status='failed', error=str(e))
+            return self._send_failed(email_id, now, to, subject, body, e)
+
+        return self._send_succeeded(email_id, now, to, subject, body)
+
+    async def send_many(self, emails: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Send several emails concurrently.
+
+        At most MAX_POOL_CONNECTIONS sends are in flight at once, each on its
+        own authenticated connection. The connections are closed when the
+        batch is done, since the loop running it (e.g. asyncio.run) may end.
+
+        Args:
+            emails: List of send_email keyword argument dicts
+
+        Returns:
+            List of send_email results, in the same order as emails
+        """
+        try:
+            return list(await asyncio.gather(*(self.send_email_async(**email) for email in emails)))
+        finally:
+            await self.aclose()
+
+    async def _acquire_async_smtp(self):
+        """
+        Borrow an idle aiosmtplib connection, or open one if under the limit.
+
+        Returns (connection, messages already sent on it).
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._async_loop:
+            # Connections and the semaphore belong to the loop that made them
+            self._drop_async_idle()
+            self._async_loop = loop
+            self._async_slots = asyncio.Semaphore(MAX_POOL_CONNECTIONS)
+
+        await self._async_slots.acquire()
+        try:
+            while self._async_idle:
+                smtp, sent = self._async_idle.pop()
+                if smtp.is_connected:
+                    return smtp, sent
+
+            smtp = aiosmtplib.SMTP(hostname=SMTP_HOST, port=SMTP_PORT, use_tls=True)
+            await smtp.connect()
+            try:
+                await smtp.login(*self._creds)
+            except Exception:
+                smtp.close()
+                raise
+            return smtp, 0
+        except BaseException:
+            self._async_slots.release()
+            raise
+
+    async def _release_async_smtp(self, smtp, sent: int, discard: bool = False):
+        """Return a borrowed connection; it is closed if discard or it reached MAX_MESSAGES_PER_CONNECTION."""
+        try:
+            if discard:
+                smtp.close()
+            elif sent >= MAX_MESSAGES_PER_CONNECTION:
+                await _quit_async_smtp(smtp)
+            else:
+                self._async_idle.append((smtp, sent))
+        finally:
+            self._async_slots.release()
+
+    def _drop_async_idle(self):
+        """Close idle connections left from an earlier event loop."""
+        idle, self._async_idle = self._async_idle, []
+        for smtp, _ in idle:
+            try:
+                smtp.close()
+            except Exception:
+                pass
+
+    async def aclose(self):
+        """Close idle aiosmtplib connections opened by send_email_async."""
+        if asyncio.get_running_loop() is not self._async_loop:
+            self._drop_async_idle()
+            return
+        idle, self._async_idle = self._async_idle, []
+        for smtp, _ in idle:
+            await _quit_async_smtp(smtp)
+
+    async def handle_tool_call_async(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Async entry point for MCP tool execution."""
+        if tool_name == 'send_email':
+            return await self.send_email_async(**arguments)
+        return await asyncio.to_thread(self.handle_tool_call, tool_name, arguments)
+
+    def _build_message(self, to: str, subject: str, body: str,
+                       reply_to: Optional[str] = None) -> bytes:
+        """
+        Serialize an outgoing email for sendmail.
+
+        The body is sent once, as text/html if it contains HTML tags and as
+        text/plain otherwise. The common case - ASCII headers - is assembled
+        directly from a fixed envelope; headers that need RFC 2047 encoding
+        go through the email package instead.
+        """
+        subtype = 'html' if _is_html(body) else 'plain'
+        headers_plain = (
+            self._from_header is not None
+            and _is_plain_header(to)
+            and _is_plain_header(subject)
+            and (not reply_to or _is_plain_header(reply_to))
+        )
+        if not headers_plain:
+            return self._build_mime_message(to, subject, body, subtype, reply_to)
+
+        charset, encoding, payload = _encode_body(body)
+        envelope = [self._from_header, f"To: {to}\r\n", f"Subject: {subject}\r\n"]
+        if reply_to:
+            envelope.append(f"Reply-To: {reply_to}\r\n")
+        envelope.append(MIME_HEADERS_TEMPLATE.format(
+            subtype=subtype, charset=charset, encoding=encoding))
+        envelope.append(payload)
+        envelope.append('\r\n')
+        return ''.join(envelope).encode('ascii')
+
+    def _build_mime_message(self, to: str, subject: str, body: str, subtype: str,
+                            reply_to: Optional[str] = None) -> bytes:
+        """Serialize the message with the email package (handles non-ASCII headers)."""
+        msg = EmailMessage(policy=SMTP_POLICY)
+        msg['From'] = self.email_user
+        msg['To'] = to
+        msg['Subject'] = subject
+
+        if reply_to:
+            msg['Reply-To'] = reply_to
+
+        msg.set_content(body, subtype=subtype)
+
+        buffer = io.BytesIO()
+        BytesGenerator(buffer, mangle_from_=False, policy=SMTP_POLICY).flatten(msg)
+        return buffer.getvalue()
+
+    def _new_id(self, now: datetime) -> str:
+        """Build a unique email/draft ID: timestamp plus a per-process sequence number."""
+        return now.strftime('%Y%m%d_%H%M%S_') + f"{next(_id_sequence):05d}"
+
+    def _missing_credentials(self, email_id: str) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": "Email credentials not configured. Set EMAIL_USER and EMAIL_PASS environment variables.",
+            "email_id": email_id
+        }
+
+    def _send_succeeded(self, email_id: str, now: datetime, to: str, subject: str, body: str,
+                        daily_rows: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Log a sent email and build the tool result."""
+        self._log_email(email_id, now, to, subject, body, status='sent', daily_rows=daily_rows)
+
+        logger.info(f"Email sent successfully to {to} (ID: {email_id})")
+
+        return {
+            "success": True,
+            "message": f"Email sent successfully to {to}",
+            "email_id": email_id,
+            "timestamp": now.isoformat()
+        }
+
+    def _send_failed(self, email_id: str, now: datetime, to: str, subject: str, body: str,
+                     error: Exception, daily_rows: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Log a failed email and build the tool result."""
+        self._log_email(email_id, now, to, subject, body, status='failed', error=str(error),
+                        daily_rows=daily_rows)
+
+        if isinstance(error, AUTH_ERRORS):
+            logger.error(f"SMTP Authentication failed: {error}")
             return {
                 "success": False,
-                "error": str(e),
+                "error": "Authentication failed. Check EMAIL_USER and EMAIL_PASS (use App Password, not regular password).",
                 "email_id": email_id
             }
 
+        logger.error(f"Failed to send email: {error}")
+        return {
+            "success": False,
+            "error": str(error),
+            "email_id": email_id
+        }
+
+    def _sendmail(self, to: str, payload: bytes):
+        """Send a serialized message over a pooled connection (one retry on disconnect)."""
+        for attempt in (1, 2):
+            conn = self._pool.acquire()
+            try:
+                conn.smtp.sendmail(self.email_user, to, payload)
+            except (smtplib.SMTPServerDisconnected, ConnectionError):
+                # Connection dropped between the health check and the send
+                self._pool.release(conn, discard=True)
+                if attempt == 2:
+                    raise
+                continue
+            except smtplib.SMTPException:
+                # The server refused the message; the connection is still usable
+                self._pool.release(conn)
+                raise
+            except Exception:
+                # Timeout or other socket error: the server may already have
+                # accepted the message, so drop the connection but don't resend
+                self._pool.release(conn, discard=True)
+                raise
+            conn.sent += 1
+            self._pool.release(conn)
+            return
+
+    def _load_approved_draft(self, draft_id: str) -> Optional[Dict[str, str]]:
+        """Read recipient, subject and body back from an approved draft file."""
+        draft_file = self.approved_folder / f'EMAIL_DRAFT_{draft_id}.md'
+        if not draft_file.exists():
+            return None
+
+        fields, body = frontmatter_util.parse(draft_file.read_text())
+        if not fields.get('to') or not fields.get('subject'):
+            return None
+
+        # The body is the "## Email Body" section, up to the next rule
+        _, _, section = body.partition('## Email Body')
+        return {
+            'to': fields['to'],
+            'subject': fields['subject'],
+            'body': section.split('\n---', 1)[0].strip()
+        }
+
+    def _mark_draft_sent(self, draft_id: str):
+        """Move a sent draft from /Approved to /Done so it can't be sent again."""
+        draft_file = f'EMAIL_DRAFT_{draft_id}.md'
+        try:
+            self.done_folder.mkdir(exist_ok=True)
+            (self.approved_folder / draft_file).replace(self.done_folder / draft_file)
+        except OSError as e:
+            logger.error(f"Sent draft {draft_id} but could not move it to /Done: {e}")
+
+    def flush_drafts(self, draft_ids: List[str]) -> Dict[str, Any]:
+        """
+        Send several approved drafts in parallel; each sent draft is moved
+        to /Done.
+
+        Each worker borrows a connection from the SMTP pool, so a backlog of
+        K drafts takes roughly ceil(K / MAX_POOL_CONNECTIONS) send round-trips.
+
+        Args:
+            draft_ids: IDs of drafts that have been moved to /Approved
+
+        Returns:
+            Dict with per-draft results
+        """
+        results = {}
+        jobs = {}
+        for draft_id in draft_ids:
+            draft = self._load_approved_draft(draft_id)
+            if draft is None:
+                results[draft_id] = {
+                    "success": False,
+                    "error": f"No approved draft found with ID: {draft_id}"
+                }
+            else:
+                jobs[draft_id] = draft
+
+        if jobs:
+            with ThreadPoolExecutor(max_workers=MAX_POOL_CONNECTIONS) as executor:
+                futures = {
+                    draft_id: executor.submit(self.send_email, **draft)
+                    for draft_id, draft in jobs.items()
+                }
+                for draft_id, future in futures.items():
+                    results[draft_id] = future.result()
+                    if results[draft_id].get("success"):
+                        self._mark_draft_sent(draft_id)
+
+        sent = sum(1 for r in results.values() if r.get("success"))
+        return {
+            "success": sent == len(draft_ids),
+            "sent": sent,
+            "failed": len(draft_ids) - sent,
+            "results": results
+        }
+
+    def close(self):
+        """Close the pooled SMTP connections and flush the daily log."""
+        if self._pool is not None:
+            self._pool.close()
+        self._drop_async_idle()
+        self._close_logs()
+
     def draft_email(self, to: str, subject: str, body: str, context: str = "") -> Dict[str, Any]:
         """
         Create an email draft for human approval.
@@ -243,18 +917,16 @@ class EmailServer:
         Returns:
             Dict with draft details
         """
-        draft_id = datetime.now().strftime('%Y%m%d_%H%M%S')
-        approval_folder = self.vault_path / 'Pending_Approval'
-        approval_folder.mkdir(parents=True, exist_ok=True)
-
-        draft_file = approval_folder / f'EMAIL_DRAFT_{draft_id}.md'
+        now = datetime.now()
+        draft_id = self._new_id(now)
+        draft_file = self.approval_folder / f'EMAIL_DRAFT_{draft_id}.md'
 
         content = f'''---
 type: email_draft
 draft_id: {draft_id}
 to: {to}
 subject: {subject}
-created: {datetime.now().isoformat()}
+created: {now.isoformat()}
 status: pending_approval
 ---
 
@@ -296,11 +968,20 @@ When rejected:
 
 ---
 
-*Draft created by AI Employee at {datetime.now().strftime('%Y-%m-%d %H:%M')}*
+*Draft created by AI Employee at {now.strftime('%Y-%m-%d %H:%M')}*
 *Awaiting human approval before sending*
 '''
 
-        draft_file.write_text(content)
+        # Written before replying, so success means the draft is on disk
+        try:
+            draft_file.write_text(content)
+        except OSError as e:
+            logger.error(f"Could not write email draft {draft_file}: {e}")
+            return {
+                "success": False,
+                "error": f"Could not write draft file: {e}",
+                "draft_id": draft_id
+            }
         logger.info(f"Email draft created: {draft_file}")
 
         return {
@@ -314,116 +995,294 @@ When rejected:
 
     def list_drafts(self) -> Dict[str, Any]:
         """List all email drafts pending approval."""
-        approval_folder = self.vault_path / 'Pending_Approval'
-        drafts = list(approval_folder.glob('EMAIL_DRAFT_*.md'))
-
+        self._drain_io()
         draft_list = []
-        for draft in drafts:
-            content = draft.read_text()
-            # Extract basic info from frontmatter
-            lines = content.split('\n')
-            draft_info = {'file': draft.name}
-            for line in lines[:15]:
-                if line.startswith('to:'):
-                    draft_info['to'] = line.split(':', 1)[1].strip()
-                elif line.startswith('subject:'):
-                    draft_info['subject'] = line.split(':', 1)[1].strip()
-                elif line.startswith('created:'):
-                    draft_info['created'] = line.split(':', 1)[1].strip()
+        draft_cache = {}
+        for name, path in self._scan_draft_files():
+            try:
+                mtime = os.stat(path).st_mtime
+            except FileNotFoundError:
+                continue
+            cached = self._draft_cache.get(name)
+            if cached is not None and cached[0] == mtime:
+                draft_info = cached[1]
+            else:
+                draft_info = self._read_draft_info(name, path)
+            draft_cache[name] = (mtime, draft_info)
             draft_list.append(draft_info)
 
+        # Only keep drafts that still exist
+        self._draft_cache = draft_cache
+
         return {
             "success": True,
             "count": len(draft_list),
             "drafts": draft_list
         }
 
+    def _scan_draft_files(self) -> List[Tuple[str, str]]:
+        """
+        Return (name, path) for every EMAIL_DRAFT_*.md file.
+
+        The listing is reused while the folder's mtime is unchanged (no file
+        added, removed or renamed). Edits to existing drafts are still picked
+        up by the per-file mtime check in list_drafts.
+        """
+        try:
+            dir_mtime = os.stat(self.approval_folder).st_mtime
+        except FileNotFoundError:
+            return []
+
+        if self._drafts_dir_mtime != dir_mtime:
+            with os.scandir(self.approval_folder) as entries:
+                self._draft_files = [
+                    (entry.name, entry.path) for entry in entries
+                    if entry.name.startswith('EMAIL_DRAFT_') and entry.name.endswith('.md')
+                ]
+            self._drafts_dir_mtime = dir_mtime
+        return self._draft_files
+
+    def _read_draft_info(self, name: str, path: str) -> Dict[str, str]:
+        """Extract basic info from a draft's frontmatter without reading the body."""
+        with open(path, 'rb') as f:
+            head = f.read(DRAFT_HEADER_BYTES)
+
+        # Only match inside the frontmatter block, not the draft body
+        frontmatter = head.split(b'\n---', 1)[0]
+        draft_info = {'file': name}
+        for key, value in DRAFT_FRONTMATTER_RE.findall(frontmatter):
+            draft_info[key.decode()] = value.decode('utf-8', errors='ignore').strip()
+        return draft_info
+
     def get_email_status(self, email_id: str) -> Dict[str, Any]:
         """Check the status of a sent email."""
+        self._drain_io()
+
+        with self._email_log_lock:
+            location = self._email_offsets.get(email_id)
+            if location is not None:
+                fp = self._get_email_log()
+                fp.flush()
+                offset, length = location
+                return _load_json(os.pread(fp.fileno(), length, offset))
+
+        # Emails logged before emails.jsonl existed have their own JSON file
         log_file = self.logs_folder / f'{email_id}.json'
 
         if log_file.exists():
-            with open(log_file, 'r') as f:
-                return json.load(f)
+            return _load_json(log_file.read_bytes())
         else:
             return {
                 "success": False,
                 "error": f"No email found with ID: {email_id}"
             }
 
-    def _log_email(self, email_id: str, to: str, subject: str, body: str,
-                   status: str, error: str = None):
-        """Log email for audit trail."""
-        log_file = self.logs_folder / f'{email_id}.json'
+    def _log_email(self, email_id: str, now: datetime, to: str, subject: str, body: str,
+                   status: str, error: str = None, daily_rows: Optional[List[str]] = None):
+        """
+        Log email for audit trail.
 
+        When daily_rows is given, the daily log entry is appended to it and
+        the caller writes it later with _write_daily_log.
+        """
         log_data = {
             "email_id": email_id,
             "to": to,
             "subject": subject,
             "body_preview": body[:200] + "..." if len(body) > 200 else body,
             "status": status,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "error": error
         }
 
-        with open(log_file, 'w') as f:
-            json.dump(log_data, f, indent=2)
-
-        # Also append to daily log
-        daily_log = self.logs_folder / f'daily_{datetime.now().strftime("%Y%m%d")}.md'
-        with open(daily_log, 'a') as f:
-            f.write(f"\n## Email {email_id}\n")
-            f.write(f"- **Time:** {datetime.now().strftime('%H:%M:%S')}\n")
-            f.write(f"- **To:** {to}\n")
-            f.write(f"- **Subject:** {subject}\n")
-            f.write(f"- **Status:** {status}\n")
-            if error:
-                f.write(f"- **Error:** {error}\n")
-            f.write("\n")
+        # Daily markdown log entry
+        entry = DAILY_LOG_ENTRY.format_map({
+            'email_id': email_id,
+            'time': now.strftime('%H:%M:%S'),
+            'to': to,
+            'subject': subject,
+            'status': status,
+            'error': DAILY_LOG_ERROR.format(error=error) if error else '',
+        })
+
+        # Disk writes happen on the log writer thread so the tool reply is not held up
+        self._submit_io(self._append_email_record, email_id, _dump_json(log_data) + b'\n')
+
+        if daily_rows is not None:
+            daily_rows.append(entry)
+            return
+
+        # Failures are flushed right away so they are visible while debugging
+        self._submit_io(self._append_daily_log, now, entry, bool(error))
+
+    def _append_email_record(self, email_id: str, record: bytes):
+        """Append one record to emails.jsonl and remember where it starts."""
+        with self._email_log_lock:
+            fp = self._get_email_log()
+            offset = fp.tell()
+            fp.write(record)
+            self._email_offsets[email_id] = (offset, len(record))
+
+    def _index_email_log(self) -> Dict[str, Tuple[int, int]]:
+        """Map email_id -> (offset, length) for the records already in emails.jsonl."""
+        offsets = {}
+        path = self.logs_folder / EMAIL_LOG_FILE
+        if not path.exists():
+            return offsets
+
+        with open(path, 'rb') as f:
+            offset = 0
+            for line in f:
+                try:
+                    offsets[_load_json(line)['email_id']] = (offset, len(line))
+                except (ValueError, KeyError, TypeError):
+                    pass  # Partial line from an interrupted write
+                offset += len(line)
+        return offsets
+
+    def _get_email_log(self):
+        """Return the emails.jsonl handle (read + append), opening it on first use."""
+        if self._email_log_fp is None:
+            fp = open(self.logs_folder / EMAIL_LOG_FILE, 'a+b', buffering=65536)
+            end = fp.seek(0, os.SEEK_END)
+            if end and os.pread(fp.fileno(), 1, end - 1) != b'\n':
+                # Start new records on a fresh line after an interrupted write
+                fp.write(b'\n')
+            self._email_log_fp = fp
+        return self._email_log_fp
+
+    def _append_daily_log(self, now: datetime, entry: str, flush: bool):
+        with self._daily_log_lock:
+            daily_log = self._get_daily_log(now)
+            daily_log.write(entry)
+            self._daily_log_pending += 1
+            if flush or self._daily_log_pending >= DAILY_LOG_FLUSH_EVERY:
+                daily_log.flush()
+                self._daily_log_pending = 0
+
+    def _write_daily_log(self, rows: List[str], fsync: bool = False):
+        """Write several daily log entries at once, optionally forcing them to disk."""
+        if rows:
+            self._submit_io(self._write_daily_rows, datetime.now(), ''.join(rows), fsync)
+
+    def _write_daily_rows(self, now: datetime, data: str, fsync: bool):
+        with self._daily_log_lock:
+            daily_log = self._get_daily_log(now)
+            daily_log.write(data)
+            daily_log.flush()
+            self._daily_log_pending = 0
+            if fsync:
+                os.fsync(daily_log.fileno())
+
+    def _submit_io(self, func, *args):
+        """Queue a file write on the single writer thread (keeps writes in order)."""
+        future = self._io_pool.submit(func, *args)
+        future.add_done_callback(_log_io_error)
+        with self._pending_io_lock:
+            self._pending_io = [f for f in self._pending_io if not f.done()]
+            self._pending_io.append(future)
+
+    def _drain_io(self):
+        """Wait for all queued file writes to finish."""
+        with self._pending_io_lock:
+            pending, self._pending_io = self._pending_io, []
+        wait(pending)
+
+    def _get_daily_log(self, now: datetime):
+        """Return the buffered handle for today's log, reopening it on date rollover."""
+        today = now.date()
+        if self._daily_log_fp is None or self._daily_log_day != today:
+            if self._daily_log_fp is not None:
+                self._daily_log_fp.close()
+            daily_log = self.logs_folder / f'daily_{now.strftime("%Y%m%d")}.md'
+            self._daily_log_fp = open(daily_log, 'a', buffering=8192)
+            self._daily_log_day = today
+            self._daily_log_pending = 0
+        return self._daily_log_fp
+
+    def _close_logs(self):
+        """Finish queued log writes, then flush and close the log handles."""
+        self._drain_io()
+        with self._email_log_lock:
+            if self._email_log_fp is not None:
+                self._email_log_fp.close()
+                self._email_log_fp = None
+        with self._daily_log_lock:
+            if self._daily_log_fp is not None:
+                self._daily_log_fp.close()
+                self._daily_log_fp = None
 
     def handle_tool_call(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handle a tool call from Claude.
         This is the main entry point for MCP tool execution.
         """
-        if tool_name not in self.tools:
+        entry = self._dispatch.get(tool_name)
+        if entry is None:
             return {
                 "success": False,
                 "error": f"Unknown tool: {tool_name}"
             }
 
-        tool_func = self.tools[tool_name]
+        tool_func, required = entry
+        if not required.issubset(arguments):
+            missing = ', '.join(sorted(required.difference(arguments)))
+            return {
+                "success": False,
+                "error": f"Missing required arguments for {tool_name}: {missing}"
+            }
+
         return tool_func(**arguments)
 
 
 # MCP Server runner (for production use with Claude)
+REPL_MENU = (
+    "\nTest Commands:\n"
+    "  1. draft <to> <subject> - Create a draft\n"
+    "  2. list - List pending drafts\n"
+    "  3. send <to> <subject> <body> - Send email (requires approval)\n"
+    "  4. quit - Exit\n"
+    "\n> "
+)
+
+
+def _format_result(result: Dict[str, Any]) -> str:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(result, indent=2)
+
+
 def run_mcp_server(vault_path: str):
     """
     Run the MCP server in standalone mode.
     In production, this would integrate with Claude's MCP protocol.
+
+    Output is written as one block per command rather than line by line.
     """
+    try:
+        import readline  # noqa: F401 - line editing and history for input()
+    except ImportError:
+        pass
+
     server = EmailServer(vault_path)
 
-    print("=" * 50)
-    print("MCP Email Server Started")
-    print("=" * 50)
-    print(f"Vault: {vault_path}")
-    print(f"Email User: {server.email_user or 'NOT SET'}")
-    print("\nAvailable Tools:")
-    for tool in server.get_tool_definitions():
-        print(f"  - {tool['name']}: {tool['description']}")
-    print("=" * 50)
+    banner = [
+        "=" * 50,
+        "MCP Email Server Started",
+        "=" * 50,
+        f"Vault: {vault_path}",
+        f"Email User: {server.email_user or 'NOT SET'}",
+        "\nAvailable Tools:",
+    ]
+    banner.extend(f"  - {tool['name']}: {tool['description']}" for tool in server.get_tool_definitions())
+    banner.append("=" * 50)
+    sys.stdout.write("\n".join(banner) + "\n")
 
     # For testing: interactive mode
     while True:
-        print("\nTest Commands:")
-        print("  1. draft <to> <subject> - Create a draft")
-        print("  2. list - List pending drafts")
-        print("  3. send <to> <subject> <body> - Send email (requires approval)")
-        print("  4. quit - Exit")
-
+        output = None
         try:
-            cmd = input("\n> ").strip()
+            cmd = input(REPL_MENU).strip()
 
             if cmd.startswith('draft'):
                 parts = cmd.split(' ', 2)
@@ -434,11 +1293,11 @@ def run_mcp_server(vault_path: str):
                         body="This is a test email body.",
                         context="Testing the MCP email server"
                     )
-                    print(json.dumps(result, indent=2))
+                    output = _format_result(result)
 
             elif cmd == 'list':
                 result = server.list_drafts()
-                print(json.dumps(result, indent=2))
+                output = _format_result(result)
 
             elif cmd.startswith('send'):
                 parts = cmd.split(' ', 3)
@@ -448,22 +1307,25 @@ def run_mcp_server(vault_path: str):
                         subject=parts[2],
                         body=parts[3]
                     )
-                    print(json.dumps(result, indent=2))
+                    output = _format_result(result)
 
             elif cmd == 'quit':
                 break
 
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             break
         except Exception as e:
-            print(f"Error: {e}")
+            output = f"Error: {e}"
 
-    print("\nMCP Email Server stopped.")
+        if output is not None:
+            sys.stdout.write(output + "\n")
+            sys.stdout.flush()
 
+    sys.stdout.write("\nMCP Email Server stopped.\n")
+    sys.stdout.flush()
 
-if __name__ == '__main__':
-    import sys
 
+if __name__ == '__main__':
     if len(sys.argv) < 2:
         print("Usage: python email_server.py <vault_path>")
         sys.exit(1)
@@ -20,43 +20,325 @@ SETUP REQUIRED:
 """
 
 import os
+import re
 import json
+import time
+import random
+import queue
+import atexit
+import asyncio
+import itertools
 import logging
+import threading
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional, List, Tuple, Protocol
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('SocialMediaServer')
 
+# Posts newer than this count towards the weekly summary
+WEEKLY_SUMMARY_SECONDS = 7 * 86400
+
+# How long a platform's analytics are reused before querying the API again
+ANALYTICS_CACHE_TTL = 60
+
+@dataclass(frozen=True, slots=True)
+class SocialConfig:
+    """Platform credentials, read from the environment once at import."""
+    facebook_token: Optional[str]
+    facebook_page_id: Optional[str]
+    instagram_token: Optional[str]
+    instagram_account_id: Optional[str]
+    twitter_api_key: Optional[str]
+    twitter_api_secret: Optional[str]
+    twitter_access_token: Optional[str]
+    twitter_access_secret: Optional[str]
+
+    @classmethod
+    def from_env(cls) -> 'SocialConfig':
+        env = os.environ
+        return cls(
+            facebook_token=env.get('FACEBOOK_ACCESS_TOKEN'),
+            facebook_page_id=env.get('FACEBOOK_PAGE_ID'),
+            instagram_token=env.get('INSTAGRAM_ACCESS_TOKEN'),
+            instagram_account_id=env.get('INSTAGRAM_ACCOUNT_ID'),
+            twitter_api_key=env.get('TWITTER_API_KEY'),
+            twitter_api_secret=env.get('TWITTER_API_SECRET'),
+            twitter_access_token=env.get('TWITTER_ACCESS_TOKEN'),
+            twitter_access_secret=env.get('TWITTER_ACCESS_SECRET')
+        )
+
+
+SOCIAL_CONFIG = SocialConfig.from_env()
+
+# Platform length limits (characters)
+TWITTER_MAX_CHARS = 280
+INSTAGRAM_MAX_CHARS = 2200
+
+# Per-platform request budgets as (requests, period in seconds)
+RATE_LIMITS = {
+    'facebook': (200, 3600),
+    'instagram': (200, 3600),
+    'twitter': (150, 60)
+}
+
+# Analytics result for platforms without credentials (copied per response)
+NOT_CONFIGURED = {"success": False, "error": "Not configured"}
+
+# How often a 429 response is retried after waiting out Retry-After
+RATE_LIMIT_RETRIES = 2
+RETRY_AFTER_DEFAULT = 1.0
+RETRY_JITTER = 0.5
+
+# Daily post logs written as a single JSON array, before the switch to JSONL
+LEGACY_LOG_RE = re.compile(r'^(facebook|instagram|twitter)_\d{8}\.json$')
+
+# Background post-log writer: flush at most this often, or once this many entries queue up
+LOG_FLUSH_INTERVAL = 0.2
+LOG_FLUSH_BATCH = 50
+
+# Keys every draft_social_posts item needs, and the ones it may have
+DRAFT_REQUIRED_KEYS = frozenset({'platforms', 'content'})
+DRAFT_ALLOWED_KEYS = DRAFT_REQUIRED_KEYS | {'scheduled_time'}
+
+# Suffix for draft file names so drafts created in the same second don't collide
+_draft_sequence = itertools.count()
+
+
+def _dump_log_line(entry: Dict[str, Any]) -> bytes:
+    """Serialize a log entry as one newline-terminated JSON line (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(entry, separators=(',', ':'), ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+def _load_json(data: bytes) -> Any:
+    """Parse JSON from raw bytes (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket allowing `rate` requests per `period` seconds.
 
-class SocialMediaPlatform(ABC):
-    """Base class for social media platforms."""
+    Callers that find the bucket empty reserve a future token and sleep
+    until it is due. A 429 response can push the whole bucket back via
+    defer().
+    """
 
-    @abstractmethod
-    def post(self, content: str, media_urls: List[str] = None) -> Dict[str, Any]:
+    def __init__(self, rate: int, period: float):
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.period)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens * self.period / self.rate if self._tokens < 0 else 0.0
+            return max(delay, self._blocked_until - now)
+
+    def acquire(self):
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def defer(self, seconds: float):
+        """Hold back all requests for the next `seconds`."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+# One limiter per platform, shared by every client in the process
+_rate_limiters = {name: RateLimiter(rate, period) for name, (rate, period) in RATE_LIMITS.items()}
+
+
+def _retry_after(value: Optional[str]) -> float:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return RETRY_AFTER_DEFAULT
+    try:
+        return max(0.0, float(value))
+    except ValueError:
         pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return RETRY_AFTER_DEFAULT
 
-    @abstractmethod
-    def get_analytics(self) -> Dict[str, Any]:
-        pass
 
+class RateLimitedSession(requests.Session):
+    """requests session that takes a rate-limit token before every request."""
+
+    def __init__(self, limiter: RateLimiter):
+        super().__init__()
+        self.limiter = limiter
+
+    def request(self, method, url, *args, **kwargs):
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            self.limiter.acquire()
+            response = super().request(method, url, *args, **kwargs)
+            if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+                return response
+            # 429 means the request was not processed, so even POSTs are safe to resend
+            self.limiter.defer(_retry_after(response.headers.get('Retry-After'))
+                               + random.uniform(0, RETRY_JITTER))
+        return response
+
+
+def make_http_session(limiter: Optional[RateLimiter] = None) -> requests.Session:
+    """
+    Create a requests session with keep-alive connection pooling.
+
+    Reusing the session avoids a new TCP + TLS handshake per API call.
+    Idempotent requests are retried on 5xx; POSTs are never retried, so a
+    post cannot be published twice. With a limiter, every request first
+    takes a token and 429s are retried after Retry-After. 429 is left out of
+    the adapter's retries so only the limiter handles it.
+    """
+    session = RateLimitedSession(limiter) if limiter is not None else requests.Session()
+    retries = Retry(total=2, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504])
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries))
+    return session
+
+
+def run_with_session(func):
+    """
+    Run an async function that takes an aiohttp session and return its result.
+
+    A fresh session (and event loop) is used per call, since aiohttp sessions
+    cannot be shared between event loops.
+    """
+    async def runner():
+        connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await func(session)
+
+    return asyncio.run(runner())
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+class SocialMediaPlatform(Protocol):
+    """Interface the server expects from each social media platform."""
+
+    access_token: Optional[str]
+
+    def post(self, content: str, media_urls: List[str] = None) -> Dict[str, Any]: ...
+
+    def get_analytics(self) -> Dict[str, Any]: ...
+
+    async def get_analytics_async(self, session) -> Dict[str, Any]: ...
+
+
+class PlatformAPI:
+    """Shared plumbing for the platform API clients."""
+
+    # Platform name used in error messages
+    name = ""
+
+    def _bind_unconfigured(self):
+        """
+        Point the API entry points at the not-configured stubs when no token is set.
+
+        Called once from __init__, so the real methods run without a token check.
+        """
+        if self.access_token:
+            return
+        self.post = self._unconfigured_post
+        self.get_analytics = self._unconfigured_analytics
+        self.get_analytics_async = self._unconfigured_analytics_async
+        if hasattr(self, 'post_async'):
+            self.post_async = self._unconfigured_post_async
+
+    def _unconfigured_post(self, content: str, media_urls: List[str] = None) -> Dict[str, Any]:
+        return {"success": False, "error": f"{self.name} access token not configured"}
+
+    async def _unconfigured_post_async(self, session, content: str, media_urls: List[str]) -> Dict[str, Any]:
+        return self._unconfigured_post(content, media_urls)
+
+    def _unconfigured_analytics(self) -> Dict[str, Any]:
+        return dict(NOT_CONFIGURED)
 
-class FacebookAPI(SocialMediaPlatform):
+    async def _unconfigured_analytics_async(self, session) -> Dict[str, Any]:
+        return dict(NOT_CONFIGURED)
+
+    async def get_analytics_async(self, session) -> Dict[str, Any]:
+        """Get analytics over a shared aiohttp session."""
+        try:
+            url, params, headers = self._analytics_request()
+            data = await self._request_json_async(session, 'GET', url, params=params, headers=headers)
+            return {"success": True, "data": data}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    async def _request_json_async(self, session, method: str, url: str, **kwargs) -> Any:
+        """Rate-limited aiohttp request returning the JSON body; 429s wait out Retry-After."""
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            await self._limiter.acquire_async()
+            async with session.request(method, url, **kwargs) as response:
+                if response.status != 429 or attempt == RATE_LIMIT_RETRIES:
+                    return await response.json(content_type=None)
+                self._limiter.defer(_retry_after(response.headers.get('Retry-After'))
+                                    + random.uniform(0, RETRY_JITTER))
+
+    def _analytics_request(self) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+        """Return (url, params, headers) for the analytics request."""
+        raise NotImplementedError
+
+
+class FacebookAPI(PlatformAPI):
     """Facebook Graph API integration."""
 
-    def __init__(self):
-        self.access_token = os.getenv('FACEBOOK_ACCESS_TOKEN')
-        self.page_id = os.getenv('FACEBOOK_PAGE_ID')
+    name = "Facebook"
+
+    def __init__(self, config: SocialConfig = SOCIAL_CONFIG):
+        self.access_token = config.facebook_token
+        self.page_id = config.facebook_page_id
         self.api_url = "https://graph.facebook.com/v18.0"
+        self._limiter = _rate_limiters['facebook']
+        self._session = make_http_session(self._limiter)
+        self._bind_unconfigured()
 
     def post(self, content: str, media_urls: List[str] = None) -> Dict[str, Any]:
         """Post to Facebook page."""
-        if not self.access_token:
-            return {"success": False, "error": "Facebook access token not configured"}
-
         try:
             url = f"{self.api_url}/{self.page_id}/feed"
             data = {
@@ -64,7 +346,7 @@ class FacebookAPI(SocialMediaPlatform):
                 "access_token": self.access_token
             }
 
-            response = requests.post(url, data=data)
+            response = self._session.post(url, data=data)
             result = response.json()
 
             if "id" in result:
@@ -82,46 +364,64 @@ class FacebookAPI(SocialMediaPlatform):
 
     def get_analytics(self) -> Dict[str, Any]:
         """Get Facebook page analytics."""
-        if not self.access_token:
-            return {"success": False, "error": "Not configured"}
-
         try:
-            url = f"{self.api_url}/{self.page_id}/insights"
-            params = {
-                "metric": "page_impressions,page_engaged_users,page_fans",
-                "access_token": self.access_token
-            }
-            response = requests.get(url, params=params)
+            url, params, headers = self._analytics_request()
+            response = self._session.get(url, params=params, headers=headers)
             return {"success": True, "data": response.json()}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _analytics_request(self) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+        url = f"{self.api_url}/{self.page_id}/insights"
+        params = {
+            "metric": "page_impressions,page_engaged_users,page_fans",
+            "access_token": self.access_token
+        }
+        return url, params, {}
 
-class InstagramAPI(SocialMediaPlatform):
+
+class InstagramAPI(PlatformAPI):
     """Instagram Graph API integration (Business accounts only)."""
 
-    def __init__(self):
-        self.access_token = os.getenv('INSTAGRAM_ACCESS_TOKEN')
-        self.account_id = os.getenv('INSTAGRAM_ACCOUNT_ID')
+    name = "Instagram"
+
+    def __init__(self, config: SocialConfig = SOCIAL_CONFIG):
+        self.access_token = config.instagram_token
+        self.account_id = config.instagram_account_id
         self.api_url = "https://graph.facebook.com/v18.0"
+        self._limiter = _rate_limiters['instagram']
+        self._session = make_http_session(self._limiter)
+        self._bind_unconfigured()
 
     def post(self, content: str, media_urls: List[str] = None) -> Dict[str, Any]:
-        """Post to Instagram (requires media for feed posts)."""
-        if not self.access_token:
-            return {"success": False, "error": "Instagram access token not configured"}
+        """
+        Post to Instagram (requires media for feed posts).
 
+        One image is posted as a single-image post; several images are posted
+        as a carousel.
+        """
         if not media_urls:
             return {"success": False, "error": "Instagram requires at least one image"}
 
+        if len(media_urls) > 1 and AIOHTTP_AVAILABLE and not _in_event_loop():
+            # Carousel items are independent, so create them concurrently
+            return run_with_session(lambda session: self.post_async(session, content, media_urls))
+
         try:
-            # Step 1: Create media container
+            # Step 1: Create media container (plus one per carousel item)
             container_url = f"{self.api_url}/{self.account_id}/media"
-            container_data = {
-                "image_url": media_urls[0],
-                "caption": content,
-                "access_token": self.access_token
-            }
-            container_response = requests.post(container_url, data=container_data)
+            if len(media_urls) == 1:
+                container_data = self._image_container(media_urls[0], content)
+            else:
+                child_ids = []
+                for image_url in media_urls:
+                    child = self._session.post(container_url, data=self._carousel_item(image_url)).json()
+                    if "id" not in child:
+                        return {"success": False, "error": "Failed to create media container"}
+                    child_ids.append(child["id"])
+                container_data = self._carousel_container(child_ids, content)
+
+            container_response = self._session.post(container_url, data=container_data)
             container_result = container_response.json()
 
             if "id" not in container_result:
@@ -129,53 +429,119 @@ class InstagramAPI(SocialMediaPlatform):
 
             # Step 2: Publish the container
             publish_url = f"{self.api_url}/{self.account_id}/media_publish"
-            publish_data = {
-                "creation_id": container_result["id"],
-                "access_token": self.access_token
-            }
-            publish_response = requests.post(publish_url, data=publish_data)
-            publish_result = publish_response.json()
+            publish_response = self._session.post(publish_url, data=self._publish_data(container_result["id"]))
+            return self._publish_result(publish_response.json())
 
-            if "id" in publish_result:
-                return {
-                    "success": True,
-                    "platform": "instagram",
-                    "post_id": publish_result["id"],
-                    "timestamp": datetime.now().isoformat()
-                }
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    async def post_async(self, session, content: str, media_urls: List[str]) -> Dict[str, Any]:
+        """
+        Post to Instagram over an aiohttp session.
+
+        Carousel item containers are created concurrently, so an N-image
+        carousel takes three round trips instead of N + 2.
+        """
+        if not media_urls:
+            return {"success": False, "error": "Instagram requires at least one image"}
+
+        async def create(data: Dict[str, str]) -> Dict[str, Any]:
+            return await self._request_json_async(
+                session, 'POST', f"{self.api_url}/{self.account_id}/media", data=data)
+
+        try:
+            if len(media_urls) == 1:
+                container_data = self._image_container(media_urls[0], content)
             else:
-                return {"success": False, "error": "Failed to publish"}
+                children = await asyncio.gather(
+                    *(create(self._carousel_item(image_url)) for image_url in media_urls))
+                if any("id" not in child for child in children):
+                    return {"success": False, "error": "Failed to create media container"}
+                container_data = self._carousel_container([child["id"] for child in children], content)
+
+            container_result = await create(container_data)
+            if "id" not in container_result:
+                return {"success": False, "error": "Failed to create media container"}
+
+            publish_url = f"{self.api_url}/{self.account_id}/media_publish"
+            return self._publish_result(await self._request_json_async(
+                session, 'POST', publish_url, data=self._publish_data(container_result["id"])))
 
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _image_container(self, image_url: str, caption: str) -> Dict[str, str]:
+        return {
+            "image_url": image_url,
+            "caption": caption,
+            "access_token": self.access_token
+        }
+
+    def _carousel_item(self, image_url: str) -> Dict[str, str]:
+        return {
+            "image_url": image_url,
+            "is_carousel_item": "true",
+            "access_token": self.access_token
+        }
+
+    def _carousel_container(self, child_ids: List[str], caption: str) -> Dict[str, str]:
+        return {
+            "media_type": "CAROUSEL",
+            "children": ",".join(child_ids),
+            "caption": caption,
+            "access_token": self.access_token
+        }
+
+    def _publish_data(self, creation_id: str) -> Dict[str, str]:
+        return {
+            "creation_id": creation_id,
+            "access_token": self.access_token
+        }
+
+    def _publish_result(self, publish_result: Dict[str, Any]) -> Dict[str, Any]:
+        if "id" in publish_result:
+            return {
+                "success": True,
+                "platform": "instagram",
+                "post_id": publish_result["id"],
+                "timestamp": datetime.now().isoformat()
+            }
+        else:
+            return {"success": False, "error": "Failed to publish"}
+
     def get_analytics(self) -> Dict[str, Any]:
         """Get Instagram account analytics."""
-        if not self.access_token:
-            return {"success": False, "error": "Not configured"}
-
         try:
-            url = f"{self.api_url}/{self.account_id}/insights"
-            params = {
-                "metric": "impressions,reach,follower_count",
-                "period": "day",
-                "access_token": self.access_token
-            }
-            response = requests.get(url, params=params)
+            url, params, headers = self._analytics_request()
+            response = self._session.get(url, params=params, headers=headers)
             return {"success": True, "data": response.json()}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _analytics_request(self) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+        url = f"{self.api_url}/{self.account_id}/insights"
+        params = {
+            "metric": "impressions,reach,follower_count",
+            "period": "day",
+            "access_token": self.access_token
+        }
+        return url, params, {}
+
 
-class TwitterAPI(SocialMediaPlatform):
+class TwitterAPI(PlatformAPI):
     """Twitter/X API v2 integration."""
 
-    def __init__(self):
-        self.api_key = os.getenv('TWITTER_API_KEY')
-        self.api_secret = os.getenv('TWITTER_API_SECRET')
-        self.access_token = os.getenv('TWITTER_ACCESS_TOKEN')
-        self.access_secret = os.getenv('TWITTER_ACCESS_SECRET')
+    name = "Twitter"
+
+    def __init__(self, config: SocialConfig = SOCIAL_CONFIG):
+        self.api_key = config.twitter_api_key
+        self.api_secret = config.twitter_api_secret
+        self.access_token = config.twitter_access_token
+        self.access_secret = config.twitter_access_secret
         self.api_url = "https://api.twitter.com/2"
+        self._limiter = _rate_limiters['twitter']
+        self._session = make_http_session(self._limiter)
+        self._bind_unconfigured()
 
     def _get_oauth_header(self) -> Dict[str, str]:
         """Generate OAuth header for Twitter API."""
@@ -185,12 +551,10 @@ class TwitterAPI(SocialMediaPlatform):
 
     def post(self, content: str, media_urls: List[str] = None) -> Dict[str, Any]:
         """Post a tweet."""
-        if not self.access_token:
-            return {"success": False, "error": "Twitter access token not configured"}
-
         # Twitter has 280 character limit
-        if len(content) > 280:
-            return {"success": False, "error": f"Tweet too long ({len(content)}/280 chars)"}
+        length = len(content)
+        if length > TWITTER_MAX_CHARS:
+            return {"success": False, "error": f"Tweet too long ({length}/{TWITTER_MAX_CHARS} chars)"}
 
         try:
             url = f"{self.api_url}/tweets"
@@ -199,7 +563,7 @@ class TwitterAPI(SocialMediaPlatform):
 
             data = {"text": content}
 
-            response = requests.post(url, headers=headers, json=data)
+            response = self._session.post(url, headers=headers, json=data)
             result = response.json()
 
             if "data" in result and "id" in result["data"]:
@@ -217,19 +581,198 @@ class TwitterAPI(SocialMediaPlatform):
 
     def get_analytics(self) -> Dict[str, Any]:
         """Get Twitter account analytics."""
-        if not self.access_token:
-            return {"success": False, "error": "Not configured"}
-
         try:
-            url = f"{self.api_url}/users/me"
-            headers = self._get_oauth_header()
-            params = {"user.fields": "public_metrics"}
-
-            response = requests.get(url, headers=headers, params=params)
+            url, params, headers = self._analytics_request()
+            response = self._session.get(url, headers=headers, params=params)
             return {"success": True, "data": response.json()}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _analytics_request(self) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+        url = f"{self.api_url}/users/me"
+        params = {"user.fields": "public_metrics"}
+        return url, params, self._get_oauth_header()
+
+
+# Markdown for approval drafts, filled with str.format_map
+DRAFT_TEMPLATE = '''---
+type: social_post
+platforms: {platforms}
+created: {created}
+scheduled: {scheduled}
+status: pending_approval
+---
+
+# Social Media Post - Approval Required
+
+## Target Platforms
+{platform_labels}
+
+## Post Content
+
+{content}
+
+---
+
+## Character Counts
+- Twitter: {length}/280 {twitter_status}
+- Facebook: {length} (no limit)
+- Instagram: {length}/2200 {instagram_status}
+
+## Actions
+
+- [ ] **APPROVE** - Post to selected platforms
+- [ ] **REJECT** - Do not post
+- [ ] **EDIT** - Modify before posting
+
+---
+
+*Created by AI Employee at {created_at}*
+'''
+
+WEEKLY_SUMMARY_TEMPLATE = '''# Weekly Social Media Summary
+**Generated:** {generated}
+**Period:** Last 7 days
+
+---
+
+## 📊 Overview
+
+| Metric | Value |
+|--------|-------|
+| Posts Published | {posts_count} |
+| Platforms Active | {active} |
+
+---
+
+## 📈 Platform Performance
+
+### Facebook
+- Status: {facebook}
+
+### Instagram
+- Status: {instagram}
+
+### Twitter
+- Status: {twitter}
+
+---
+
+## 📝 Posts This Week
+
+{posts}
+---
+
+## 💡 Recommendations
+
+1. Post consistently (2-3 times per week)
+2. Engage with comments and messages
+3. Share project updates and learning journey
+4. Use relevant hashtags
+
+---
+
+*Generated by AI Employee Social Media Server*
+'''
+
+
+# MCP tool definitions
+TOOL_DEFINITIONS = [
+    {
+        "name": "post_to_social",
+        "description": "Post content to a social media platform (requires approval)",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "platform": {
+                    "type": "string",
+                    "enum": ["facebook", "instagram", "twitter"],
+                    "description": "Target platform"
+                },
+                "content": {
+                    "type": "string",
+                    "description": "Post content"
+                },
+                "media_urls": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional media URLs"
+                }
+            },
+            "required": ["platform", "content"]
+        }
+    },
+    {
+        "name": "draft_social_post",
+        "description": "Create a social media post draft for approval",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "platforms": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Target platforms"
+                },
+                "content": {
+                    "type": "string",
+                    "description": "Post content"
+                },
+                "scheduled_time": {
+                    "type": "string",
+                    "description": "Optional scheduled time (ISO format)"
+                }
+            },
+            "required": ["platforms", "content"]
+        }
+    },
+    {
+        "name": "draft_social_posts",
+        "description": "Create several social media post drafts for approval at once",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "drafts": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "platforms": {"type": "array", "items": {"type": "string"}},
+                            "content": {"type": "string"},
+                            "scheduled_time": {"type": "string"}
+                        },
+                        "required": ["platforms", "content"]
+                    },
+                    "description": "Drafts to create"
+                }
+            },
+            "required": ["drafts"]
+        }
+    },
+    {
+        "name": "get_social_analytics",
+        "description": "Get analytics from social media platforms",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "platform": {
+                    "type": "string",
+                    "enum": ["facebook", "instagram", "twitter", "all"],
+                    "description": "Platform to get analytics from"
+                }
+            },
+            "required": ["platform"]
+        }
+    },
+    {
+        "name": "generate_weekly_summary",
+        "description": "Generate weekly social media summary",
+        "parameters": {
+            "type": "object",
+            "properties": {}
+        }
+    }
+]
+
 
 class SocialMediaServer:
     """
@@ -237,17 +780,32 @@ class SocialMediaServer:
     Manages posting, analytics, and content scheduling.
     """
 
+    # Methods exposed as MCP tools (each tool name is the method name)
+    _TOOL_NAMES = frozenset({
+        'post_to_social',
+        'draft_social_post',
+        'draft_social_posts',
+        'get_social_analytics',
+        'generate_weekly_summary'
+    })
+
     def __init__(self, vault_path: str):
         self.vault_path = Path(vault_path)
         self.logs_folder = self.vault_path / 'Logs' / 'SocialMedia'
         self.logs_folder.mkdir(parents=True, exist_ok=True)
 
         # Initialize platforms
-        self.platforms = {
+        self.platforms: Dict[str, SocialMediaPlatform] = {
             'facebook': FacebookAPI(),
             'instagram': InstagramAPI(),
             'twitter': TwitterAPI()
         }
+        # Credentials are fixed at construction, so this never changes
+        self._configured = frozenset(name for name, api in self.platforms.items() if api.access_token)
+
+        # Drafts awaiting human approval
+        self.pending_folder = self.vault_path / 'Pending_Approval'
+        self.pending_folder.mkdir(parents=True, exist_ok=True)
 
         # Post queue folder
         self.post_queue = self.vault_path / 'Marketing' / 'Social_Queue'
@@ -257,82 +815,26 @@ class SocialMediaServer:
         self.posted_archive = self.vault_path / 'Marketing' / 'Social_Posted'
         self.posted_archive.mkdir(parents=True, exist_ok=True)
 
+        self._migrate_legacy_logs()
+
+        # platform -> (monotonic fetch time, analytics result)
+        self._analytics_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+        # Post logs are written by a background thread so posting never waits on disk
+        self._log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._log_closed = False
+        self._log_lock = threading.Lock()
+        self._log_files: Dict[Tuple[str, str], Path] = {}
+        self._log_thread = threading.Thread(
+            target=self._log_writer, name='social-log', daemon=True)
+        self._log_thread.start()
+        atexit.register(self.close)
+
         logger.info(f"Social Media Server initialized for vault: {vault_path}")
 
     def get_tool_definitions(self) -> List[Dict]:
         """Return MCP tool definitions."""
-        return [
-            {
-                "name": "post_to_social",
-                "description": "Post content to a social media platform (requires approval)",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "platform": {
-                            "type": "string",
-                            "enum": ["facebook", "instagram", "twitter"],
-                            "description": "Target platform"
-                        },
-                        "content": {
-                            "type": "string",
-                            "description": "Post content"
-                        },
-                        "media_urls": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Optional media URLs"
-                        }
-                    },
-                    "required": ["platform", "content"]
-                }
-            },
-            {
-                "name": "draft_social_post",
-                "description": "Create a social media post draft for approval",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "platforms": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Target platforms"
-                        },
-                        "content": {
-                            "type": "string",
-                            "description": "Post content"
-                        },
-                        "scheduled_time": {
-                            "type": "string",
-                            "description": "Optional scheduled time (ISO format)"
-                        }
-                    },
-                    "required": ["platforms", "content"]
-                }
-            },
-            {
-                "name": "get_social_analytics",
-                "description": "Get analytics from social media platforms",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "platform": {
-                            "type": "string",
-                            "enum": ["facebook", "instagram", "twitter", "all"],
-                            "description": "Platform to get analytics from"
-                        }
-                    },
-                    "required": ["platform"]
-                }
-            },
-            {
-                "name": "generate_weekly_summary",
-                "description": "Generate weekly social media summary",
-                "parameters": {
-                    "type": "object",
-                    "properties": {}
-                }
-            }
-        ]
+        return TOOL_DEFINITIONS
 
     def post_to_social(self, platform: str, content: str,
                        media_urls: List[str] = None) -> Dict[str, Any]:
@@ -341,6 +843,9 @@ class SocialMediaServer:
             return {"success": False, "error": f"Unknown platform: {platform}"}
 
         result = self.platforms[platform].post(content, media_urls)
+        if result.get("success"):
+            # New post changes the numbers, so don't serve stale analytics
+            self._analytics_cache.pop(platform, None)
 
         # Log the post
         self._log_post(platform, content, result)
@@ -350,127 +855,203 @@ class SocialMediaServer:
     def draft_social_post(self, platforms: List[str], content: str,
                           scheduled_time: str = None) -> Dict[str, Any]:
         """Create a draft post for human approval."""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        draft_file = self.vault_path / 'Pending_Approval' / f'SOCIAL_POST_{timestamp}.md'
-
-        platforms_str = ', '.join(platforms)
-
-        draft_content = f'''---
-type: social_post
-platforms: {platforms_str}
-created: {datetime.now().isoformat()}
-scheduled: {scheduled_time or 'immediate'}
-status: pending_approval
----
-
-# Social Media Post - Approval Required
-
-## Target Platforms
-{', '.join([f"**{p.title()}**" for p in platforms])}
-
-## Post Content
-
-{content}
+        draft_file, encoded, length = self._render_draft(
+            platforms, content, scheduled_time, datetime.now())
 
----
-
-## Character Counts
-- Twitter: {len(content)}/280 {'✅' if len(content) <= 280 else '❌ TOO LONG'}
-- Facebook: {len(content)} (no limit)
-- Instagram: {len(content)}/2200 {'✅' if len(content) <= 2200 else '❌ TOO LONG'}
-
-## Actions
-
-- [ ] **APPROVE** - Post to selected platforms
-- [ ] **REJECT** - Do not post
-- [ ] **EDIT** - Modify before posting
-
----
-
-*Created by AI Employee at {datetime.now().strftime('%Y-%m-%d %H:%M')}*
-'''
-
-        draft_file.write_text(draft_content)
+        draft_file.write_bytes(encoded)
         logger.info(f"Created social post draft: {draft_file}")
 
         return {
             "success": True,
             "draft_file": str(draft_file),
             "platforms": platforms,
-            "content_length": len(content)
+            "content_length": length
         }
 
+    def draft_social_posts(self, drafts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create several draft posts for approval in one call.
+
+        Each item takes the draft_social_post arguments. All valid drafts
+        are rendered first, then written with raw os.write calls; a
+        malformed item gets an error result and the rest are still created.
+        """
+        now = datetime.now()
+        rendered = []
+        for draft in drafts:
+            error = self._draft_item_error(draft)
+            if error is None:
+                rendered.append(self._render_draft(
+                    draft['platforms'], draft['content'], draft.get('scheduled_time'), now))
+            else:
+                rendered.append(error)
+
+        results = []
+        for item, draft in zip(rendered, drafts):
+            if isinstance(item, str):
+                results.append({"success": False, "error": item})
+                continue
+
+            draft_file, encoded, length = item
+            try:
+                fd = os.open(draft_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    view = memoryview(encoded)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                results.append({"success": False, "error": str(e)})
+                continue
+
+            results.append({
+                "success": True,
+                "draft_file": str(draft_file),
+                "platforms": draft['platforms'],
+                "content_length": length
+            })
+
+        created = sum(1 for r in results if r["success"])
+        logger.info(f"Created {created}/{len(drafts)} social post drafts")
+
+        return {"success": created == len(drafts), "created": created, "results": results}
+
+    @staticmethod
+    def _draft_item_error(draft: Any) -> Optional[str]:
+        """Why a draft_social_posts item can't be drafted (None if it can)."""
+        if not isinstance(draft, dict):
+            return "Draft item must be an object"
+        missing = DRAFT_REQUIRED_KEYS - draft.keys()
+        if missing:
+            return f"Missing fields: {', '.join(sorted(missing))}"
+        unexpected = draft.keys() - DRAFT_ALLOWED_KEYS
+        if unexpected:
+            return f"Unexpected fields: {', '.join(sorted(unexpected))}"
+        platforms = draft['platforms']
+        if not isinstance(platforms, list) or not all(isinstance(p, str) for p in platforms):
+            return "platforms must be a list of strings"
+        if not isinstance(draft['content'], str):
+            return "content must be a string"
+        if not isinstance(draft.get('scheduled_time') or '', str):
+            return "scheduled_time must be a string"
+        return None
+
+    def _render_draft(self, platforms: List[str], content: str,
+                      scheduled_time: Optional[str], now: datetime) -> Tuple[Path, bytes, int]:
+        """Return (draft path, UTF-8 markdown, content length) for one draft."""
+        draft_id = now.strftime('%Y%m%d_%H%M%S_') + f"{next(_draft_sequence):05d}"
+        draft_file = self.pending_folder / f'SOCIAL_POST_{draft_id}.md'
+
+        length = len(content)
+        draft_content = DRAFT_TEMPLATE.format_map({
+            'platforms': ', '.join(platforms),
+            'created': now.isoformat(),
+            'scheduled': scheduled_time or 'immediate',
+            'platform_labels': ', '.join([f"**{p.title()}**" for p in platforms]),
+            'content': content,
+            'length': length,
+            'twitter_status': '✅' if length <= TWITTER_MAX_CHARS else '❌ TOO LONG',
+            'instagram_status': '✅' if length <= INSTAGRAM_MAX_CHARS else '❌ TOO LONG',
+            'created_at': f'{now:%Y-%m-%d %H:%M}'
+        })
+        return draft_file, draft_content.encode('utf-8'), length
+
     def get_social_analytics(self, platform: str) -> Dict[str, Any]:
         """Get analytics from one or all platforms."""
         if platform == "all":
+            if AIOHTTP_AVAILABLE and self._configured and not _in_event_loop():
+                # Query all platforms concurrently instead of one after another
+                return run_with_session(
+                    lambda session: self.get_social_analytics_async(platform, session))
+
             results = {}
-            for name, api in self.platforms.items():
-                results[name] = api.get_analytics()
+            for name in self.platforms:
+                if name in self._configured:
+                    results[name] = self._platform_analytics(name)
+                else:
+                    results[name] = dict(NOT_CONFIGURED)
             return {"success": True, "analytics": results}
 
         if platform not in self.platforms:
             return {"success": False, "error": f"Unknown platform: {platform}"}
 
-        return self.platforms[platform].get_analytics()
+        return self._platform_analytics(platform)
+
+    async def get_social_analytics_async(self, platform: str, session) -> Dict[str, Any]:
+        """Async variant of get_social_analytics using an aiohttp session."""
+        if platform == "all":
+            results = {}
+            stale = []
+            for name in self.platforms:
+                if name not in self._configured:
+                    results[name] = dict(NOT_CONFIGURED)
+                    continue
+                cached = self._cached_analytics(name)
+                if cached is None:
+                    stale.append(name)
+                else:
+                    results[name] = cached
+            fetched = await asyncio.gather(
+                *(self.platforms[name].get_analytics_async(session) for name in stale))
+            for name, result in zip(stale, fetched):
+                results[name] = self._cache_analytics(name, result)
+            return {"success": True,
+                    "analytics": {name: results[name] for name in self.platforms}}
+
+        if platform not in self.platforms:
+            return {"success": False, "error": f"Unknown platform: {platform}"}
+
+        cached = self._cached_analytics(platform)
+        if cached is not None:
+            return cached
+        result = await self.platforms[platform].get_analytics_async(session)
+        return self._cache_analytics(platform, result)
+
+    def _platform_analytics(self, name: str) -> Dict[str, Any]:
+        """Analytics for one platform, served from cache while fresh."""
+        cached = self._cached_analytics(name)
+        if cached is not None:
+            return cached
+        return self._cache_analytics(name, self.platforms[name].get_analytics())
+
+    def _cached_analytics(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return cached analytics for a platform if younger than the TTL."""
+        entry = self._analytics_cache.get(name)
+        if entry is not None and time.monotonic() - entry[0] < ANALYTICS_CACHE_TTL:
+            return entry[1]
+        return None
+
+    def _cache_analytics(self, name: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Remember successful analytics results; failures are retried next call."""
+        if result.get("success"):
+            self._analytics_cache[name] = (time.monotonic(), result)
+        return result
 
     def generate_weekly_summary(self) -> Dict[str, Any]:
         """Generate weekly social media performance summary."""
-        summary_file = self.vault_path / 'Logs' / 'SocialMedia' / f'weekly_summary_{datetime.now().strftime("%Y%m%d")}.md'
+        now = datetime.now()
+        summary_file = self.vault_path / 'Logs' / 'SocialMedia' / f'weekly_summary_{now:%Y%m%d}.md'
 
         # Collect analytics
         analytics = self.get_social_analytics("all")
 
         # Count posts this week
-        posts_this_week = list(self.posted_archive.glob('*.md'))
-
-        summary_content = f'''# Weekly Social Media Summary
-**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}
-**Period:** Last 7 days
-
----
-
-## 📊 Overview
-
-| Metric | Value |
-|--------|-------|
-| Posts Published | {len(posts_this_week)} |
-| Platforms Active | {len([p for p in self.platforms.values() if p.access_token])} |
-
----
-
-## 📈 Platform Performance
-
-### Facebook
-- Status: {'✅ Connected' if self.platforms['facebook'].access_token else '❌ Not Connected'}
-
-### Instagram
-- Status: {'✅ Connected' if self.platforms['instagram'].access_token else '❌ Not Connected'}
-
-### Twitter
-- Status: {'✅ Connected' if self.platforms['twitter'].access_token else '❌ Not Connected'}
-
----
-
-## 📝 Posts This Week
-
-'''
-        for post in posts_this_week[-10:]:  # Last 10 posts
-            summary_content += f"- {post.name}\n"
-
-        summary_content += '''
----
-
-## 💡 Recommendations
-
-1. Post consistently (2-3 times per week)
-2. Engage with comments and messages
-3. Share project updates and learning journey
-4. Use relevant hashtags
-
----
-
-*Generated by AI Employee Social Media Server*
-'''
+        posts_this_week = self._recent_posts(time.time() - WEEKLY_SUMMARY_SECONDS)
+
+        connected = {name: bool(api.access_token) for name, api in self.platforms.items()}
+        status = {name: '✅ Connected' if on else '❌ Not Connected'
+                  for name, on in connected.items()}
+
+        summary_content = WEEKLY_SUMMARY_TEMPLATE.format_map({
+            'generated': f'{now:%Y-%m-%d %H:%M}',
+            'posts_count': len(posts_this_week),
+            'active': sum(connected.values()),
+            'facebook': status['facebook'],
+            'instagram': status['instagram'],
+            'twitter': status['twitter'],
+            'posts': ''.join([f"- {name}\n" for name in posts_this_week[:10]])  # Last 10 posts
+        })
 
         summary_file.write_text(summary_content)
 
@@ -480,41 +1061,133 @@ status: pending_approval
             "posts_count": len(posts_this_week)
         }
 
+    def _recent_posts(self, cutoff: float) -> List[str]:
+        """Names of archived posts modified since cutoff, newest first."""
+        with os.scandir(self.posted_archive) as entries:
+            recent = [(entry.stat().st_mtime, entry.name) for entry in entries
+                      if entry.name.endswith('.md')]
+
+        recent = [item for item in recent if item[0] >= cutoff]
+        recent.sort(reverse=True)
+        return [name for _, name in recent]
+
     def _log_post(self, platform: str, content: str, result: Dict[str, Any]):
-        """Log social media post for audit trail."""
-        log_file = self.logs_folder / f'{platform}_{datetime.now().strftime("%Y%m%d")}.json'
+        """
+        Log social media post for audit trail.
+
+        Entries are appended as one JSON object per line, so logging a post
+        never re-reads or rewrites the day's log. The append itself happens
+        on the log writer thread.
+        """
+        # Successful posts already carry the post time; only read the clock otherwise
+        timestamp = result.get("timestamp") or datetime.now().isoformat()
+        log_file = self._log_file(platform, timestamp[:10])
 
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "platform": platform,
             "content_preview": content[:100] + "..." if len(content) > 100 else content,
             "result": result
         }
 
-        # Append to log file
-        logs = []
-        if log_file.exists():
-            with open(log_file, 'r') as f:
-                logs = json.load(f)
-
-        logs.append(log_entry)
-
-        with open(log_file, 'w') as f:
-            json.dump(logs, f, indent=2)
+        item = (log_file, _dump_log_line(log_entry))
+        with self._log_lock:
+            if not self._log_closed:
+                self._log_queue.put(item)
+                return
+        self._write_log_batch([item])
+
+    def _log_file(self, platform: str, day: str) -> Path:
+        """Path of a platform's JSONL log for an ISO date (YYYY-MM-DD)."""
+        key = (platform, day)
+        log_file = self._log_files.get(key)
+        if log_file is None:
+            log_file = self.logs_folder / f'{platform}_{day.replace("-", "")}.jsonl'
+            self._log_files[key] = log_file
+        return log_file
+
+    def _migrate_legacy_logs(self):
+        """
+        Convert old JSON-array post logs into the JSONL logs.
+
+        Legacy entries are placed before anything already in the day's
+        .jsonl file, so the merged log stays in time order.
+        """
+        with os.scandir(self.logs_folder) as entries:
+            legacy = [entry.path for entry in entries if LEGACY_LOG_RE.match(entry.name)]
+
+        for path in legacy:
+            legacy_file = Path(path)
+            log_file = legacy_file.with_suffix('.jsonl')
+            try:
+                logs = _load_json(legacy_file.read_bytes())
+                lines = b''.join(_dump_log_line(entry) for entry in logs)
+                if log_file.exists():
+                    lines += log_file.read_bytes()
+                tmp_file = log_file.with_suffix('.jsonl.tmp')
+                tmp_file.write_bytes(lines)
+                os.replace(tmp_file, log_file)
+                legacy_file.unlink()
+            except (OSError, ValueError, TypeError) as e:
+                logger.warning(f"Could not migrate legacy post log {legacy_file.name}: {e}")
+                continue
+            logger.info(f"Migrated {len(logs)} entries from {legacy_file.name} to {log_file.name}")
+
+    def _log_writer(self):
+        """Drain the log queue, appending entries in batches."""
+        while True:
+            item = self._log_queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+            while len(batch) < LOG_FLUSH_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._log_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._write_log_batch(batch)
+            if stop:
+                return
+
+    def _write_log_batch(self, batch: List[Tuple[Path, bytes]]):
+        """Append queued log lines, one open per log file."""
+        by_file: Dict[Path, List[bytes]] = {}
+        for log_file, line in batch:
+            by_file.setdefault(log_file, []).append(line)
+
+        for log_file, lines in by_file.items():
+            try:
+                with open(log_file, 'ab') as f:
+                    f.write(b''.join(lines))
+            except OSError as e:
+                logger.error(f"Failed to write post log {log_file}: {e}")
+
+    def close(self):
+        """Flush pending post logs and stop the log writer."""
+        with self._log_lock:
+            if self._log_closed:
+                return
+            self._log_closed = True
+            self._log_queue.put(None)
+        self._log_thread.join()
 
     def handle_tool_call(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle MCP tool calls."""
-        tools = {
-            'post_to_social': self.post_to_social,
-            'draft_social_post': self.draft_social_post,
-            'get_social_analytics': self.get_social_analytics,
-            'generate_weekly_summary': self.generate_weekly_summary
-        }
-
-        if tool_name not in tools:
+        if tool_name not in self._TOOL_NAMES:
             return {"success": False, "error": f"Unknown tool: {tool_name}"}
 
-        return tools[tool_name](**arguments)
+        return getattr(self, tool_name)(**arguments)
 
 
 if __name__ == '__main__':
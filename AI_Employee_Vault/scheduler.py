@@ -7,15 +7,107 @@ import os
 import sys
 import time
 import json
+import heapq
+import queue
+import shlex
+import atexit
+import importlib
 import subprocess
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout, as_completed
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Callable
+from typing import Dict, List, Callable, Optional, Tuple
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 load_dotenv()
 
+# Longest the daemon sleeps in one go, so wall-clock changes are noticed
+MAX_IDLE_SLEEP = 300
+
+# .last_run.json is rewritten at most this often (and once more at exit)
+LAST_RUN_FLUSH_SECONDS = 60
+
+# Commands containing any of these need a shell; the rest are run directly
+SHELL_METACHARACTERS = frozenset('|&;<>()$`*?[]{}~\'"\n')
+
+# Longest a task may run, as a subprocess or in-process, before it counts as failed
+TASK_TIMEOUT = 300
+
+# Due tasks in one run_once pass run side by side on this many threads
+TASK_WORKERS = 4
+
+# How far ahead to search for the next match of a cron expression
+CRON_LOOKAHEAD_DAYS = 366
+
+# Value range of each cron field: minute, hour, day of month, month, day of week
+# (day of week follows datetime.weekday(), Monday = 0)
+CRON_FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 6))
+
+# Watchers whose single-check mode (`python <script> --test`) can run inside the
+# scheduler process instead of a fresh interpreter: script -> (module, class)
+IN_PROCESS_WATCHERS = {
+    'watchers/gmail_watcher_simple.py': ('gmail_watcher_simple', 'SimpleGmailWatcher'),
+    'watchers/approval_executor.py': ('approval_executor', 'ApprovalExecutor'),
+}
+
+
+def _dump_json(obj, indent: bool = False) -> bytes:
+    """Serialize a state file as UTF-8 JSON bytes (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _load_json(data: bytes):
+    """Parse a state file from raw bytes (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _cron_field_bits(value: str, low: int, high: int) -> int:
+    """Bitmask of the values a cron field (*, N or */N) matches; bit i set = value i matches"""
+    if value == '*':
+        return sum(1 << v for v in range(low, high + 1))
+    if value.isdigit():
+        return 1 << int(value) if low <= int(value) <= high else 0
+    if '/' in value:
+        _, interval = value.split('/')
+        step = int(interval)
+        return sum(1 << v for v in range(low, high + 1) if v % step == 0)
+    return 0
+
+
+@lru_cache(maxsize=None)
+def compile_cron(cron_expr: str) -> Optional[Tuple[int, int, int, int, int]]:
+    """Parse a cron expression once into per-field bitmasks (None if invalid)"""
+    parts = cron_expr.split()
+    if len(parts) != 5:
+        return None
+    try:
+        return tuple(_cron_field_bits(value, low, high)
+                     for value, (low, high) in zip(parts, CRON_FIELD_RANGES))
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def cron_matches(fields: Tuple[int, int, int, int, int], when: datetime) -> bool:
+    """Check a compiled cron expression against a time"""
+    minutes, hours, doms, months, dows = fields
+    return bool(minutes >> when.minute & 1 and hours >> when.hour & 1 and
+                doms >> when.day & 1 and months >> when.month & 1 and
+                dows >> when.weekday() & 1)
+
 
 class TaskScheduler:
     """
@@ -29,6 +121,15 @@ class TaskScheduler:
         self.tasks_path = self.vault_path / 'Tasks'
         self.watchers_path = self.vault_path / 'watchers'
 
+        # Log lines and last-run snapshots are written by a background thread
+        # so the scheduling loop never waits on disk. The thread keeps today's
+        # log file open and swaps it when the date changes.
+        self._log_fh = None
+        self._log_date = None
+        self._io_queue: queue.Queue = queue.Queue()
+        self._io_thread = threading.Thread(target=self._io_worker, name='scheduler-io', daemon=True)
+        self._io_thread.start()
+
         # Create directories
         self.logs_path.mkdir(exist_ok=True)
         self.tasks_path.mkdir(exist_ok=True)
@@ -40,13 +141,31 @@ class TaskScheduler:
         # Track last run times
         self.last_run_file = self.vault_path / '.last_run.json'
         self.last_run = self._load_last_run()
+        # Last run as time.monotonic() seconds, so interval checks don't parse ISO strings
+        self._last_run_mono: Dict[str, float] = {}
+        self._last_run_lock = threading.Lock()
+        self._last_run_dirty = False
+        self._last_run_saved = 0.0
+        self._last_run_timer = None
+        atexit.register(self.close)
+
+        # Cached watcher instances for in-process tasks, and tasks that must use a subprocess
+        self._task_watchers: Dict[str, object] = {}
+        self._subprocess_tasks = set()
+        # Task commands split into argument lists (None = needs a shell)
+        self._task_argv: Dict[str, Optional[List[str]]] = {}
+
+        # Independent due tasks in run_once run in parallel
+        self._pool = ThreadPoolExecutor(max_workers=TASK_WORKERS, thread_name_prefix='scheduler-task')
 
         self.log("Scheduler initialized")
 
     def _load_schedule(self) -> Dict:
         """Load schedule configuration"""
         if self.schedule_file.exists():
-            return json.loads(self.schedule_file.read_text())
+            schedule = _load_json(self.schedule_file.read_bytes())
+            self._schedule_mtime = self.schedule_file.stat().st_mtime_ns
+            return schedule
 
         # Default schedule
         default_schedule = {
@@ -89,91 +208,355 @@ class TaskScheduler:
             ]
         }
 
-        self.schedule_file.write_text(json.dumps(default_schedule, indent=2))
+        self.schedule_file.write_bytes(_dump_json(default_schedule, indent=True))
+        self._schedule_mtime = self.schedule_file.stat().st_mtime_ns
         return default_schedule
 
+    def refresh_schedule(self) -> bool:
+        """Reload .schedule.json if it changed on disk since it was last read"""
+        try:
+            mtime = self.schedule_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return False
+        if mtime == self._schedule_mtime:
+            return False
+
+        self._schedule_mtime = mtime
+        try:
+            self.schedule = _load_json(self.schedule_file.read_bytes())
+        except ValueError as e:
+            self.log(f"Invalid schedule file, keeping current schedule: {e}", 'ERROR')
+            return False
+
+        # Commands may have changed, so resolve task handlers again
+        self._close_task_watchers()
+        self._subprocess_tasks.clear()
+        self._task_argv.clear()
+        self.log("Schedule reloaded")
+        return True
+
     def _load_last_run(self) -> Dict:
         """Load last run times"""
         if self.last_run_file.exists():
             try:
-                return json.loads(self.last_run_file.read_text())
-            except:
+                return _load_json(self.last_run_file.read_bytes())
+            except (OSError, ValueError) as e:
+                self.log(f"Could not read last run times, starting fresh: {e}", 'ERROR')
                 return {}
         return {}
 
     def _save_last_run(self):
-        """Save last run times"""
-        self.last_run_file.write_text(json.dumps(self.last_run, indent=2))
+        """
+        Save last run times
+
+        Writes are throttled to one per LAST_RUN_FLUSH_SECONDS; a change
+        inside that window is written by a timer when it closes.
+        """
+        with self._last_run_lock:
+            self._last_run_dirty = True
+            wait = self._last_run_saved + LAST_RUN_FLUSH_SECONDS - time.monotonic()
+            if wait > 0:
+                if self._last_run_timer is None:
+                    self._last_run_timer = threading.Timer(wait, self._flush_last_run)
+                    self._last_run_timer.daemon = True
+                    self._last_run_timer.start()
+                return
+        self._flush_last_run()
+
+    def _flush_last_run(self):
+        """Write last run times to disk if they changed"""
+        with self._last_run_lock:
+            self._last_run_timer = None
+            if not self._last_run_dirty:
+                return
+            data = _dump_json(self.last_run)
+            self._last_run_dirty = False
+            self._last_run_saved = time.monotonic()
+        self._submit_io('state', data)
 
     def log(self, message: str, level: str = 'INFO'):
         """Log message"""
-        timestamp = datetime.now().isoformat()
-        log_entry = f"[{timestamp}] [Scheduler] [{level}] {message}"
+        now = datetime.now()
+        log_entry = f"[{now.isoformat()}] [Scheduler] [{level}] {message}"
         print(log_entry)
 
-        today = datetime.now().strftime('%Y-%m-%d')
-        log_file = self.logs_path / f'scheduler_{today}.log'
-        with open(log_file, 'a') as f:
-            f.write(log_entry + '\n')
+        self._submit_io('log', (now.strftime('%Y-%m-%d'), log_entry))
+
+    def _submit_io(self, kind: str, payload):
+        """Hand a write to the I/O thread (or do it here once that has stopped)"""
+        if self._io_thread is not None:
+            self._io_queue.put((kind, payload))
+        else:
+            self._write_io([(kind, payload)])
 
-    def parse_cron(self, cron_expr: str) -> bool:
+    def _io_worker(self):
+        """Drain queued writes; of several queued state snapshots only the newest is written"""
+        while True:
+            items = [self._io_queue.get()]
+            while True:
+                try:
+                    items.append(self._io_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in items
+            self._write_io([item for item in items if item is not None])
+            if stop:
+                self._close_log()
+                return
+
+    def _write_io(self, items: List[Tuple[str, object]]):
+        """Append log lines and write the latest last-run snapshot"""
+        state = None
+        for kind, payload in items:
+            if kind == 'state':
+                state = payload
+                continue
+            today, log_entry = payload
+            try:
+                if today != self._log_date:
+                    self._close_log()
+                    # Line buffered: each entry is one append write, whole lines stay intact
+                    self._log_fh = open(self.logs_path / f'scheduler_{today}.log', 'a', buffering=1)
+                    self._log_date = today
+                self._log_fh.write(log_entry + '\n')
+            except OSError as e:
+                print(f"[Scheduler] [ERROR] Could not write log: {e}")
+
+        if state is not None:
+            # Write a temp file and swap it in, so a crash never leaves a truncated file
+            tmp = self.last_run_file.with_suffix('.json.tmp')
+            try:
+                tmp.write_bytes(state)
+                os.replace(tmp, self.last_run_file)
+            except OSError as e:
+                print(f"[Scheduler] [ERROR] Could not save last run times: {e}")
+
+    def _close_log(self):
+        """Close the open log file"""
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+            self._log_date = None
+
+    def _close_task_watchers(self):
+        """Close and forget the cached in-process watchers (e.g. an executor's send pool and log)"""
+        watchers, self._task_watchers = self._task_watchers, {}
+        for task_name, watcher in watchers.items():
+            close = getattr(watcher, 'close', None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception as e:
+                self.log(f"Error closing watcher for {task_name}: {e}", 'WARNING')
+
+    def close(self):
+        """Close cached watchers, save pending last-run times, finish queued writes and stop the I/O thread"""
+        if self._io_thread is None:
+            return
+        self._pool.shutdown(wait=True)
+        self._close_task_watchers()
+        timer = self._last_run_timer
+        if timer is not None:
+            timer.cancel()
+        self._flush_last_run()
+
+        self._io_queue.put(None)
+        self._io_thread.join()
+        self._io_thread = None
+
+    def parse_cron(self, cron_expr: str, now: Optional[datetime] = None) -> bool:
         """
-        Simple cron parser - checks if current time matches cron expression
+        Simple cron parser - checks if now (default: current time) matches cron expression
         Format: minute hour day_of_month month day_of_week
         """
-        parts = cron_expr.split()
-        if len(parts) != 5:
+        fields = compile_cron(cron_expr)
+        if fields is None:
             return False
+        return cron_matches(fields, now or datetime.now())
 
-        now = datetime.now()
-        minute, hour, dom, month, dow = parts
+    def next_cron_time(self, cron_expr: str, after: datetime) -> Optional[datetime]:
+        """
+        Find the next minute matching a cron expression.
 
-        def matches(value: str, current: int) -> bool:
-            if value == '*':
-                return True
-            if value.isdigit():
-                return int(value) == current
-            if '/' in value:
-                _, interval = value.split('/')
-                return current % int(interval) == 0
-            return False
+        Like should_run_task, a matching minute still counts during its
+        first 30 seconds. Days are checked first, so a weekly job is found
+        without stepping through every minute in between.
+        """
+        fields = compile_cron(cron_expr)
+        if fields is None:
+            return None
+        minutes, hours, doms, months, dows = fields
+
+        start = after.replace(second=0, microsecond=0)
+        if after.second > 30:
+            start += timedelta(minutes=1)
+
+        day = start.replace(hour=0, minute=0)
+        for _ in range(CRON_LOOKAHEAD_DAYS):
+            if doms >> day.day & 1 and months >> day.month & 1 and dows >> day.weekday() & 1:
+                for h in range(24):
+                    if not hours >> h & 1:
+                        continue
+                    for m in range(60):
+                        if minutes >> m & 1:
+                            candidate = day.replace(hour=h, minute=m)
+                            if candidate >= start:
+                                return candidate
+            day += timedelta(days=1)
+
+        return None
+
+    def _record_run(self, task_name: str):
+        """
+        Remember that a task just ran
+
+        Only marks the state dirty; the run loops save once per batch of
+        tasks, and close() saves whatever is left.
+        """
+        with self._last_run_lock:
+            self._last_run_mono[task_name] = time.monotonic()
+            self.last_run[task_name] = datetime.now().isoformat()
+            self._last_run_dirty = True
 
-        return (
-            matches(minute, now.minute) and
-            matches(hour, now.hour) and
-            matches(dom, now.day) and
-            matches(month, now.month) and
-            matches(dow, now.weekday())
-        )
+    def _last_run_monotonic(self, task_name: str) -> Optional[float]:
+        """
+        Last run of a task on the monotonic clock, or None if it never ran.
+
+        Runs recorded by an earlier process are converted from their ISO
+        timestamp once and cached.
+        """
+        last = self._last_run_mono.get(task_name)
+        if last is not None:
+            return last
+
+        last_run_str = self.last_run.get(task_name)
+        if not last_run_str:
+            return None
+        try:
+            age = (datetime.now() - datetime.fromisoformat(last_run_str)).total_seconds()
+        except ValueError:
+            return None
+        last = self._last_run_mono[task_name] = time.monotonic() - age
+        return last
+
+    def next_due(self, task: Dict, now: datetime) -> Optional[float]:
+        """Return when a task is next due (epoch seconds), or None if never"""
+        if 'interval_minutes' in task:
+            last = self._last_run_monotonic(task['name'])
+            if last is None:
+                return now.timestamp()
+            return time.time() + last + task['interval_minutes'] * 60 - time.monotonic()
 
-    def should_run_task(self, task: Dict) -> bool:
-        """Check if a task should run now"""
+        if 'cron' in task:
+            next_time = self.next_cron_time(task['cron'], now)
+            return next_time.timestamp() if next_time else None
+
+        return None
+
+    def should_run_task(self, task: Dict, now: Optional[datetime] = None) -> bool:
+        """Check if a task should run now (callers checking many tasks pass one `now`)"""
         if not task.get('enabled', True):
             return False
 
-        task_name = task['name']
-        now = datetime.now()
-
         # Check interval-based tasks
         if 'interval_minutes' in task:
-            last_run_str = self.last_run.get(task_name)
-            if not last_run_str:
+            last = self._last_run_monotonic(task['name'])
+            if last is None:
                 return True
-
-            last_run = datetime.fromisoformat(last_run_str)
-            interval = timedelta(minutes=task['interval_minutes'])
-
-            return now - last_run >= interval
+            return time.monotonic() - last >= task['interval_minutes'] * 60
 
         # Check cron-based tasks
         if 'cron' in task:
+            now = now or datetime.now()
             # Only run cron tasks at the start of matching minute
             if now.second > 30:
                 return False
-            return self.parse_cron(task['cron'])
+            return self.parse_cron(task['cron'], now)
 
         return False
 
+    def _in_process_target(self, command: str) -> Optional[Tuple[str, str]]:
+        """Return (module, class) if the command is a single check of a known watcher."""
+        parts = command.split()
+        if len(parts) != 3 or parts[0] not in ('python', 'python3') or parts[2] not in ('--test', '-t'):
+            return None
+        return IN_PROCESS_WATCHERS.get(parts[1].replace('\\', '/'))
+
+    def _get_task_handler(self, task: Dict) -> Optional[Callable[[], object]]:
+        """
+        Return a cached in-process run_once handler for the task, or None
+        if it has to run as a subprocess.
+
+        The watcher module is imported once and the watcher instance is kept,
+        so later ticks skip interpreter start-up and module imports.
+        """
+        task_name = task['name']
+        watcher = self._task_watchers.get(task_name)
+        if watcher is not None:
+            return watcher.run_once
+        if task_name in self._subprocess_tasks:
+            return None
+
+        target = self._in_process_target(task['command'])
+        if target is None:
+            self._subprocess_tasks.add(task_name)
+            return None
+
+        module_name, class_name = target
+        if str(self.watchers_path) not in sys.path:
+            sys.path.insert(0, str(self.watchers_path))
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            self.log(f"Cannot import {module_name} ({e}), running {task_name} as a subprocess", 'WARNING')
+            self._subprocess_tasks.add(task_name)
+            return None
+
+        # Constructor errors (e.g. missing credentials) fail this run and are retried next time
+        watcher = self._task_watchers[task_name] = getattr(module, class_name)(str(self.vault_path))
+        return watcher.run_once
+
+    def _get_task_argv(self, task: Dict) -> Optional[List[str]]:
+        """
+        Return the task command as an argument list, or None if it uses
+        shell syntax and has to go through the shell.
+
+        Split once per task and cached; a leading python/python3 is
+        resolved to this interpreter instead of a PATH lookup.
+        """
+        task_name = task['name']
+        if task_name in self._task_argv:
+            return self._task_argv[task_name]
+
+        command = task['command']
+        argv = None
+        if not SHELL_METACHARACTERS.intersection(command):
+            argv = shlex.split(command, posix=os.name != 'nt') or None
+            if argv and argv[0] in ('python', 'python3'):
+                argv[0] = sys.executable
+        self._task_argv[task_name] = argv
+        return argv
+
+    def _run_handler(self, task_name: str, handler: Callable[[], object]):
+        """
+        Call an in-process handler, giving up after TASK_TIMEOUT seconds
+
+        The handler runs on its own daemon thread, so a hung IMAP or SMTP
+        call only strands that thread, not the scheduler or its task pool.
+        """
+        future = Future()
+
+        def target():
+            try:
+                future.set_result(handler())
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=target, name=f'scheduler-{task_name}', daemon=True).start()
+        return future.result(timeout=TASK_TIMEOUT)
+
     def run_task(self, task: Dict) -> bool:
         """Execute a scheduled task"""
         task_name = task['name']
@@ -182,19 +565,42 @@ class TaskScheduler:
         self.log(f"Running task: {task_name}")
 
         try:
-            # Run command from vault directory
+            handler = self._get_task_handler(task)
+            if handler is not None:
+                try:
+                    self._run_handler(task_name, handler)
+                    error = None
+                except FutureTimeout:
+                    # The watcher may still be stuck in run_once, so it is
+                    # dropped (not closed) and a fresh one is built next run
+                    self._task_watchers.pop(task_name, None)
+                    self.log(f"Task {task_name} timed out", 'ERROR')
+                    return False
+                except Exception as e:
+                    error = e
+
+                # Update last run time
+                self._record_run(task_name)
+
+                if error is None:
+                    self.log(f"Task {task_name} completed successfully")
+                    return True
+                self.log(f"Task {task_name} failed: {error}", 'ERROR')
+                return False
+
+            # Run command from vault directory, without a shell when possible
+            argv = self._get_task_argv(task)
             result = subprocess.run(
-                command,
-                shell=True,
+                command if argv is None else argv,
+                shell=argv is None,
                 cwd=str(self.vault_path),
                 capture_output=True,
                 text=True,
-                timeout=300  # 5 minute timeout
+                timeout=TASK_TIMEOUT
             )
 
             # Update last run time
-            self.last_run[task_name] = datetime.now().isoformat()
-            self._save_last_run()
+            self._record_run(task_name)
 
             if result.returncode == 0:
                 self.log(f"Task {task_name} completed successfully")
@@ -214,32 +620,96 @@ class TaskScheduler:
         """Run all due tasks once"""
         self.log("Checking scheduled tasks...")
 
-        tasks_run = 0
-        for task in self.schedule.get('tasks', []):
-            if self.should_run_task(task):
-                if self.run_task(task):
-                    tasks_run += 1
+        now = datetime.now()
+        due = [task for task in self.schedule.get('tasks', []) if self.should_run_task(task, now)]
+        if len(due) == 1:
+            tasks_run = int(self.run_task(due[0]))
+        else:
+            futures = [self._pool.submit(self.run_task, task) for task in due]
+            tasks_run = sum(future.result() for future in as_completed(futures))
+
+        if due:
+            self._save_last_run()
 
         self.log(f"Completed {tasks_run} tasks")
         return tasks_run
 
     def run_continuous(self, check_interval: int = 30):
-        """Run scheduler continuously"""
-        self.log(f"Starting continuous scheduler (checking every {check_interval}s)")
+        """
+        Run scheduler continuously
 
+        Tasks sit in a heap ordered by next due time and the loop sleeps
+        until the earliest one, instead of waking every check_interval to
+        re-check everything. check_interval is now the retry delay for a
+        failed interval task, and how often the schedule file is re-read
+        while no task is enabled.
+        """
+        self.log("Starting continuous scheduler")
+
+        heap = self._build_task_heap(datetime.now())
+        idle_logged = False
         while True:
+            if self.refresh_schedule():
+                heap = self._build_task_heap(datetime.now())
+                idle_logged = False
+                continue
+
+            if not heap:
+                # Nothing enabled; keep watching the schedule file for edits
+                if not idle_logged:
+                    self.log("No enabled tasks to schedule", 'WARNING')
+                    idle_logged = True
+                if self._last_run_dirty:
+                    self._save_last_run()
+                time.sleep(check_interval)
+                continue
+
+            due, index, task = heap[0]
+            delay = due - time.time()
+            if delay > 0:
+                # Save once for everything that ran since the last sleep
+                if self._last_run_dirty:
+                    self._save_last_run()
+                time.sleep(min(delay, MAX_IDLE_SLEEP))
+                continue
+
+            heapq.heappop(heap)
             try:
-                self.run_once()
+                self.run_task(task)
             except Exception as e:
                 self.log(f"Scheduler error: {e}", 'ERROR')
 
-            time.sleep(check_interval)
+            now = datetime.now()
+            if 'cron' in task:
+                # Don't fire twice in the minute that just ran
+                now = max(now, datetime.fromtimestamp(due) + timedelta(minutes=1))
+                next_due = self.next_due(task, now)
+            else:
+                # A failed run leaves last_run unchanged; retry after check_interval
+                next_due = max(self.next_due(task, now), time.time() + check_interval)
+
+            if next_due is not None:
+                heapq.heappush(heap, (next_due, index, task))
+
+    def _build_task_heap(self, now: datetime) -> List:
+        """Heap of (next due time, index, task) for every enabled task"""
+        heap = []
+        for index, task in enumerate(self.schedule.get('tasks', [])):
+            if not task.get('enabled', True):
+                continue
+            due = self.next_due(task, now)
+            if due is not None:
+                heap.append((due, index, task))
+        heapq.heapify(heap)
+        return heap
 
     def run_specific_task(self, task_name: str) -> bool:
         """Run a specific task by name"""
         for task in self.schedule.get('tasks', []):
             if task['name'] == task_name:
-                return self.run_task(task)
+                success = self.run_task(task)
+                self._save_last_run()
+                return success
 
         self.log(f"Task not found: {task_name}", 'ERROR')
         return False
@@ -5,6 +5,7 @@ Runs all components of the AI Employee system
 
 import os
 import sys
+import selectors
 import subprocess
 import threading
 import time
@@ -29,8 +30,65 @@ def print_banner():
     """)
 
 
+# Most bytes read from a component's output in one go
+OUTPUT_CHUNK_SIZE = 65536
+
+
+def start_component(name: str, command: list, cwd: str):
+    """Start a component in a subprocess, returning it (or None if it failed to start)"""
+    print(f"[STARTING] {name}...")
+    try:
+        return subprocess.Popen(
+            command,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT
+        )
+    except Exception as e:
+        print(f"[ERROR] {name} failed: {e}")
+        return None
+
+
+def stream_output(processes: dict, poll_interval: float = 1.0):
+    """
+    Print every component's output with its name as prefix, until Ctrl+C
+
+    One selector in the calling thread services all component pipes, so
+    there is no reader thread per component. Each ready pipe gets one
+    os.read, which never blocks; partial lines wait for the rest.
+    """
+    selector = selectors.DefaultSelector()
+    pending = {}
+    for name, process in processes.items():
+        selector.register(process.stdout, selectors.EVENT_READ, data=name)
+        pending[name] = b''
+
+    try:
+        while True:
+            if not selector.get_map():
+                time.sleep(poll_interval)
+                continue
+
+            for key, _ in selector.select(poll_interval):
+                name = key.data
+                chunk = os.read(key.fd, OUTPUT_CHUNK_SIZE)
+                if not chunk:
+                    # Component exited: print what is left and stop watching it
+                    selector.unregister(key.fileobj)
+                    if pending[name]:
+                        print(f"[{name}] {pending[name].decode(errors='replace').rstrip()}")
+                    pending[name] = b''
+                    continue
+
+                *lines, pending[name] = (pending[name] + chunk).split(b'\n')
+                for line in lines:
+                    print(f"[{name}] {line.decode(errors='replace').rstrip()}")
+    finally:
+        selector.close()
+
+
 def run_component(name: str, command: list, cwd: str):
-    """Run a component in a subprocess"""
+    """Run a component in a subprocess (thread-per-component fallback where pipes can't be selected)"""
     print(f"[STARTING] {name}...")
     try:
         process = subprocess.Popen(
@@ -101,27 +159,24 @@ def main():
     print("=" * 60)
     print()
 
-    threads = []
-
-    # Gmail Watcher
-    t1 = threading.Thread(
-        target=run_component,
-        args=("Gmail", ["python", "gmail_watcher_simple.py"], str(watchers_path)),
-        daemon=True
-    )
-    threads.append(t1)
-
-    # Approval Executor
-    t2 = threading.Thread(
-        target=run_component,
-        args=("Executor", ["python", "approval_executor.py"], str(watchers_path)),
-        daemon=True
-    )
-    threads.append(t2)
-
-    # Start all threads
-    for t in threads:
-        t.start()
+    components = [
+        ("Gmail", ["python", "gmail_watcher_simple.py"]),
+        ("Executor", ["python", "approval_executor.py"]),
+    ]
+
+    # Windows can only select() on sockets, so there each component keeps a reader thread
+    processes = {}
+    for name, command in components:
+        if os.name == 'nt':
+            threading.Thread(
+                target=run_component,
+                args=(name, command, str(watchers_path)),
+                daemon=True
+            ).start()
+        else:
+            process = start_component(name, command, str(watchers_path))
+            if process is not None:
+                processes[name] = process
         time.sleep(1)
 
     print()
@@ -142,10 +197,11 @@ def main():
     print("=" * 60)
 
     try:
-        while True:
-            time.sleep(1)
+        stream_output(processes)
     except KeyboardInterrupt:
         print("\n\n[SHUTDOWN] Stopping AI Employee...")
+        for process in processes.values():
+            process.terminate()
         print("Goodbye!")
 
 
@@ -5,12 +5,111 @@ Watches the queue folder and executes approved actions (sends emails, posts, etc
 
 import os
 import json
+import asyncio
 import time
 import re
+import atexit
+import importlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from dotenv import load_dotenv
-from email_sender import EmailSender
+from typing import Optional
+import frontmatter_util
+from email_sender import EmailSender, ensure_env, AIOSMTPLIB_AVAILABLE
+
+try:
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# Email draft body: the text between the rules after the To/Subject header
+BODY_RE = re.compile(r'\*\*To:\*\*.*?\n\*\*Subject:\*\*.*?\n\n---\n\n(.*?)\n\n---', re.DOTALL)
+
+# Approved item classification: the first `type:` line decides the handler.
+# It sits in the frontmatter, so only the head of the file is searched.
+ITEM_TYPE_RE = re.compile(rb'^type:\s*(\w+)', re.MULTILINE)
+ITEM_HEAD_BYTES = 4096
+ODOO_TYPES = ('odoo_invoice', 'odoo_payment')
+SOCIAL_POST_TYPES = {
+    'linkedin_post': 'linkedin',
+    'facebook_post': 'facebook',
+    'instagram_post': 'instagram',
+    'twitter_post': 'twitter',
+}
+
+# Social poster per platform: (module, class, run now). LinkedIn posts are
+# picked up from Approved/ by the poster's own cycle.
+_POSTER_REGISTRY = {
+    'linkedin': ('linkedin_poster', 'LinkedInPoster', False),
+    'facebook': ('facebook_poster', 'FacebookPoster', True),
+    'instagram': ('instagram_poster', 'InstagramPoster', True),
+    'twitter': ('twitter_x_poster', 'TwitterXPoster', True),
+}
+
+# Queue files already handled are remembered (by name and mtime) this long,
+# so one that could not be removed is not executed or parsed again
+PROCESSED_TTL = 3600
+
+# Most queue items handled per check; a bigger backlog drains over
+# back-to-back checks, which bounds the memory one check holds
+QUEUE_BATCH_SIZE = 256
+
+# Approved emails found in one queue check are sent in parallel on this many
+# threads (used when aiosmtplib is not installed)
+EMAIL_SEND_WORKERS = 4
+
+# While file events are being delivered, the full queue re-check only
+# catches missed events, so it runs at most this often
+WATCHED_RESCAN_SECONDS = 300
+
+# After a queue file event, wait this long so the writer can finish and bursts coalesce
+QUEUE_EVENT_DEBOUNCE = 0.05
+
+
+# (epoch second, ISO string) of the last formatted timestamp
+_iso_cached = (0, '')
+
+
+def _iso_now() -> str:
+    """Current local time in ISO format to the second, formatted at most once per second"""
+    global _iso_cached
+    second = int(time.time())
+    cached = _iso_cached
+    if cached[0] != second:
+        cached = _iso_cached = (second, datetime.fromtimestamp(second).isoformat())
+    return cached[1]
+
+
+class _QueueWakeup:
+    """watchdog handler that wakes the executor when a queue file appears or changes"""
+
+    def __init__(self, wakeup: threading.Event):
+        self.wakeup = wakeup
+
+    def dispatch(self, event):
+        if event.is_directory or event.event_type == 'deleted':
+            return
+        name = os.path.basename(getattr(event, 'dest_path', '') or event.src_path)
+        if name.startswith('execute_') and name.endswith('.json'):
+            self.wakeup.set()
+
+
+# Event loop running aiosmtplib sends, shared by every executor in the
+# process; started on first use
+_email_loop = None
+_email_loop_lock = threading.Lock()
+
+
+def _shared_email_loop() -> asyncio.AbstractEventLoop:
+    """The process-wide email event loop, started in a daemon thread if needed"""
+    global _email_loop
+    with _email_loop_lock:
+        if _email_loop is None:
+            _email_loop = asyncio.new_event_loop()
+            threading.Thread(target=_email_loop.run_forever, name='email-loop', daemon=True).start()
+        return _email_loop
 
 
 class ApprovalExecutor:
@@ -19,31 +118,82 @@ class ApprovalExecutor:
     """
 
     def __init__(self, vault_path: str):
-        load_dotenv()
+        ensure_env()
 
         self.vault_path = Path(vault_path)
         self.queue_path = self.vault_path / '.queue'
+        self.failed_path = self.queue_path / 'Failed'
         self.logs_path = self.vault_path / 'Logs'
 
+        # Today's log file stays open; it is swapped when the date changes
+        self._log_fh = None
+        self._log_date = None
+        self._log_lock = threading.Lock()
+        atexit.register(self.close)
+
         # Create folders
         self.queue_path.mkdir(exist_ok=True)
         self.logs_path.mkdir(exist_ok=True)
 
-        # Email sender
+        # Email sender; with aiosmtplib, sends run concurrently on the shared
+        # email loop over a few reused connections, otherwise on a small pool,
+        # so one slow SMTP round trip doesn't hold up the rest of the queue
         self.email_sender = EmailSender()
+        self._email_loop = None
+        self._email_pool = None
+        if AIOSMTPLIB_AVAILABLE:
+            self._email_loop = _shared_email_loop()
+        else:
+            self._email_pool = ThreadPoolExecutor(max_workers=EMAIL_SEND_WORKERS, thread_name_prefix='email')
+
+        # Handled queue files: name -> (mtime_ns, time.monotonic() when handled)
+        self._processed = {}
+        self._processed_pruned = time.monotonic()
+        # Names of queue files handled in the current check; items that failed
+        # before that point are left out, so the next check retries them
+        self._handled_names = set()
+
+        # Poster instances by platform, created on first use (None if not installed)
+        self._posters = {}
 
         self.log("Approval Executor initialized")
 
     def log(self, message: str, level: str = 'INFO'):
         """Write to log file"""
-        timestamp = datetime.now().isoformat()
-        log_entry = f"[{timestamp}] [{level}] {message}"
+        stamp = _iso_now()
+        log_entry = f"[{stamp}] [{level}] {message}"
         print(log_entry)
 
-        today = datetime.now().strftime('%Y-%m-%d')
-        log_file = self.logs_path / f'daily_{today}.log'
-        with open(log_file, 'a') as f:
-            f.write(log_entry + '\n')
+        today = stamp[:10]
+        with self._log_lock:
+            if today != self._log_date:
+                self._close_log()
+                # Line buffered: other watchers append to the same daily log,
+                # so each line goes out whole and in order as it's written
+                self._log_fh = open(self.logs_path / f'daily_{today}.log', 'a', buffering=1)
+                self._log_date = today
+            self._log_fh.write(log_entry + '\n')
+
+    def _close_log(self):
+        """Close the open log file"""
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+            self._log_date = None
+
+    def close(self):
+        """Stop the send pool, close SMTP connections and the log (also run at exit)"""
+        atexit.unregister(self.close)
+        if self._email_pool is not None:
+            self._email_pool.shutdown(wait=True)
+            self._email_pool = None
+        if self._email_loop is not None and self._email_loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(self.email_sender.aclose(), self._email_loop).result(timeout=10)
+            except Exception as e:
+                self.log(f"Error closing SMTP connections: {e}", 'WARNING')
+        with self._log_lock:
+            self._close_log()
 
     def parse_email_draft(self, content: str) -> dict:
         """Parse email draft markdown to extract email details"""
@@ -54,20 +204,12 @@ class ApprovalExecutor:
         }
 
         # Extract from frontmatter
-        frontmatter_match = re.search(r'^---\n(.*?)\n---', content, re.DOTALL)
-        if frontmatter_match:
-            frontmatter = frontmatter_match.group(1)
-
-            to_match = re.search(r'to:\s*(.+)', frontmatter)
-            if to_match:
-                result['to'] = to_match.group(1).strip()
-
-            subject_match = re.search(r'subject:\s*(.+)', frontmatter)
-            if subject_match:
-                result['subject'] = subject_match.group(1).strip()
+        fields, body = frontmatter_util.parse(content)
+        result['to'] = fields.get('to') or None
+        result['subject'] = fields.get('subject') or None
 
         # Extract body - look for content between --- markers after frontmatter
-        body_match = re.search(r'\*\*To:\*\*.*?\n\*\*Subject:\*\*.*?\n\n---\n\n(.*?)\n\n---', content, re.DOTALL)
+        body_match = BODY_RE.search(body)
         if body_match:
             result['body'] = body_match.group(1).strip()
         else:
@@ -78,41 +220,75 @@ class ApprovalExecutor:
 
         return result
 
-    def execute_email(self, queue_item: dict, approved_file: Path) -> bool:
-        """Execute an approved email draft"""
-        try:
+    def _prepare_email(self, approved_file: Path, content: str = None) -> Optional[dict]:
+        """Parse an approved email draft; None (after logging) if it can't be sent"""
+        if content is None:
             content = approved_file.read_text(encoding='utf-8')
-            email_data = self.parse_email_draft(content)
+        email_data = self.parse_email_draft(content)
 
-            if not email_data['to'] or not email_data['subject']:
-                self.log(f"Missing email details in {approved_file.name}", 'ERROR')
-                return False
+        if not email_data['to'] or not email_data['subject']:
+            self.log(f"Missing email details in {approved_file.name}", 'ERROR')
+            return None
 
-            # Use a default body if not found
-            if not email_data['body']:
-                email_data['body'] = "Thank you for your email. I will get back to you shortly."
+        # Use a default body if not found
+        if not email_data['body']:
+            email_data['body'] = "Thank you for your email. I will get back to you shortly."
 
-            self.log(f"Sending email to {email_data['to']}")
+        self.log(f"Sending email to {email_data['to']}")
+        return email_data
+
+    def _log_email_result(self, email_data: dict, success: bool) -> bool:
+        """Log the outcome of an email send"""
+        if success:
+            self.log(f"Email sent successfully to {email_data['to']}")
+        else:
+            self.log(f"Failed to send email to {email_data['to']}", 'ERROR')
+        return success
+
+    def execute_email(self, queue_item: dict, approved_file: Path, content: str = None) -> bool:
+        """Execute an approved email draft (content is the file's text if already read)"""
+        try:
+            email_data = self._prepare_email(approved_file, content)
+            if email_data is None:
+                return False
 
             success = self.email_sender.reply_to_email(
                 to=email_data['to'],
                 original_subject=email_data['subject'],
                 body=email_data['body']
             )
+            return self._log_email_result(email_data, success)
 
-            if success:
-                self.log(f"Email sent successfully to {email_data['to']}")
-            else:
-                self.log(f"Failed to send email to {email_data['to']}", 'ERROR')
+        except Exception as e:
+            self.log(f"Error executing email: {e}", 'ERROR')
+            return False
 
-            return success
+    async def execute_email_async(self, queue_item: dict, approved_file: Path, content: str = None) -> bool:
+        """Async variant of execute_email, sending through aiosmtplib"""
+        try:
+            email_data = self._prepare_email(approved_file, content)
+            if email_data is None:
+                return False
+
+            success = await self.email_sender.areply_to_email(
+                to=email_data['to'],
+                original_subject=email_data['subject'],
+                body=email_data['body']
+            )
+            return self._log_email_result(email_data, success)
 
         except Exception as e:
             self.log(f"Error executing email: {e}", 'ERROR')
             return False
 
-    def process_queue_item(self, queue_file: Path):
-        """Process a single queue item"""
+    def process_queue_item(self, queue_file: Path) -> Optional[Future]:
+        """
+        Process a single queue item
+
+        Emails are handed to the email loop (or send pool); the returned
+        future completes once the email is sent and the item removed from
+        the queue.
+        """
         try:
             # Read queue item
             queue_data = json.loads(queue_file.read_text())
@@ -123,37 +299,47 @@ class ApprovalExecutor:
 
             if not source_path.exists():
                 self.log(f"Source file not found: {source_path}", 'ERROR')
-                queue_file.unlink()
+                self._remove_queue_item(queue_file, item_id)
                 return
 
-            # Determine type and execute
-            content = source_path.read_text(encoding='utf-8')
-
-            if 'type: email_draft' in content or 'type: email' in content:
-                success = self.execute_email(queue_data, source_path)
-
-            elif 'type: linkedin_post' in content:
-                success = self._execute_social_post('linkedin', item_id, source_path)
-
-            elif 'type: facebook_post' in content:
-                success = self._execute_social_post('facebook', item_id, source_path)
-
-            elif 'type: instagram_post' in content:
-                success = self._execute_social_post('instagram', item_id, source_path)
-
-            elif 'type: twitter_post' in content:
-                success = self._execute_social_post('twitter', item_id, source_path)
-
-            elif 'type: social_post' in content:
+            # Determine type from the head of the file; the whole file is only
+            # read and decoded for the item types that use its text
+            with open(source_path, 'rb') as f:
+                data = f.read(ITEM_HEAD_BYTES)
+                match = ITEM_TYPE_RE.search(data)
+                if match is None and len(data) == ITEM_HEAD_BYTES:
+                    data += f.read()
+                    match = ITEM_TYPE_RE.search(data)
+                item_type = match.group(1).decode('ascii') if match else ''
+
+                content = None
+                if item_type.startswith('email') or item_type == 'social_post' or item_type in ODOO_TYPES:
+                    # Same newline translation read_text() does, so CRLF drafts
+                    # (e.g. written on Windows) parse like LF ones
+                    content = (data + f.read()).decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+            if item_type.startswith('email'):
+                if self._email_loop is not None:
+                    return asyncio.run_coroutine_threadsafe(
+                        self._send_queued_email_async(queue_file, item_id, queue_data, source_path, content),
+                        self._email_loop)
+                return self._email_pool.submit(self._send_queued_email, queue_file, item_id,
+                                               queue_data, source_path, content)
+
+            elif item_type in SOCIAL_POST_TYPES:
+                success = self._execute_social_post(SOCIAL_POST_TYPES[item_type], item_id, source_path)
+
+            elif item_type == 'social_post':
                 # Generic social post - determine platform from content
+                content_lower = content.lower()
                 platform = 'unknown'
                 for p in ['linkedin', 'facebook', 'instagram', 'twitter']:
-                    if p in content.lower():
+                    if p in content_lower:
                         platform = p
                         break
                 success = self._execute_social_post(platform, item_id, source_path)
 
-            elif 'type: odoo_invoice' in content or 'type: odoo_payment' in content:
+            elif item_type in ODOO_TYPES:
                 success = self._execute_odoo_action(item_id, source_path, content)
 
             else:
@@ -161,56 +347,93 @@ class ApprovalExecutor:
                 success = True
 
             # Remove from queue after processing
-            queue_file.unlink()
-            self.log(f"Removed {item_id} from queue")
+            self._remove_queue_item(queue_file, item_id)
 
         except Exception as e:
             self.log(f"Error processing queue item: {e}", 'ERROR')
+            self._fail_queue_item(queue_file)
+        return None
 
-    def _execute_social_post(self, platform: str, item_id: str, source_path: Path) -> bool:
-        """Execute an approved social media post by delegating to the platform poster."""
-        self.log(f"Executing {platform} post: {item_id}")
+    def _send_queued_email(self, queue_file: Path, item_id: str, queue_data: dict,
+                           source_path: Path, content: str):
+        """Send an approved email (on the send pool), then remove its queue item"""
+        self.execute_email(queue_data, source_path, content)
+        try:
+            self._remove_queue_item(queue_file, item_id)
+        except Exception as e:
+            self.log(f"Error processing queue item: {e}", 'ERROR')
 
+    async def _send_queued_email_async(self, queue_file: Path, item_id: str, queue_data: dict,
+                                       source_path: Path, content: str):
+        """Send an approved email (on the email loop), then remove its queue item"""
+        await self.execute_email_async(queue_data, source_path, content)
         try:
-            vault_path = str(self.vault_path)
+            self._remove_queue_item(queue_file, item_id)
+        except Exception as e:
+            self.log(f"Error processing queue item: {e}", 'ERROR')
 
-            if platform == 'linkedin':
-                from linkedin_poster import LinkedInPoster
-                poster = LinkedInPoster(vault_path)
-                # The poster will pick it up from Approved/ in its next cycle
-                self.log(f"LinkedIn post {item_id} queued for poster")
-                return True
+    def _remove_queue_item(self, queue_file: Path, item_id: str):
+        """Delete a handled queue file"""
+        # Recorded before the unlink, so an item whose file can't be removed
+        # is still not executed again
+        self._handled_names.add(queue_file.name)
+        queue_file.unlink()
+        self.log(f"Removed {item_id} from queue")
+
+    def _fail_queue_item(self, queue_file: Path):
+        """Move a queue file that could not be processed to .queue/Failed for review"""
+        # Recorded even if the move fails, so the item is not retried ahead
+        # of newer ones on every check (until it changes or PROCESSED_TTL passes)
+        self._handled_names.add(queue_file.name)
+        try:
+            self.failed_path.mkdir(exist_ok=True)
+            queue_file.replace(self.failed_path / queue_file.name)
+            self.log(f"Moved {queue_file.name} to {self.failed_path}", 'WARNING')
+        except OSError as e:
+            self.log(f"Could not move {queue_file.name} to Failed: {e}", 'ERROR')
 
-            elif platform == 'facebook':
-                from facebook_poster import FacebookPoster
-                poster = FacebookPoster(vault_path)
-                poster.run_once()
-                return True
+    def _execute_social_post(self, platform: str, item_id: str, source_path: Path) -> bool:
+        """Execute an approved social media post by delegating to the platform poster."""
+        self.log(f"Executing {platform} post: {item_id}")
 
-            elif platform == 'instagram':
-                from instagram_poster import InstagramPoster
-                poster = InstagramPoster(vault_path)
-                poster.run_once()
-                return True
+        entry = _POSTER_REGISTRY.get(platform)
+        if entry is None:
+            self.log(f"Unknown social platform: {platform}", 'WARNING')
+            return True
 
-            elif platform == 'twitter':
-                from twitter_x_poster import TwitterXPoster
-                poster = TwitterXPoster(vault_path)
-                poster.run_once()
+        try:
+            poster = self._get_poster(platform)
+            if poster is None:
+                self.log(f"Social post {item_id} marked as executed (poster not installed)")
                 return True
 
+            if entry[2]:
+                poster.run_once()
             else:
-                self.log(f"Unknown social platform: {platform}", 'WARNING')
-                return True
-
-        except ImportError as e:
-            self.log(f"Poster module not available for {platform}: {e}", 'WARNING')
-            self.log(f"Social post {item_id} marked as executed (poster not installed)")
+                self.log(f"LinkedIn post {item_id} queued for poster")
             return True
+
         except Exception as e:
             self.log(f"Error executing {platform} post: {e}", 'ERROR')
             return False
 
+    def _get_poster(self, platform: str):
+        """Return the cached poster for a platform, importing it on first use"""
+        if platform in self._posters:
+            return self._posters[platform]
+
+        module_name, class_name, _ = _POSTER_REGISTRY[platform]
+        try:
+            poster_class = getattr(importlib.import_module(module_name), class_name)
+        except ImportError as e:
+            self.log(f"Poster module not available for {platform}: {e}", 'WARNING')
+            poster = None
+        else:
+            poster = poster_class(str(self.vault_path))
+
+        self._posters[platform] = poster
+        return poster
+
     def _execute_odoo_action(self, item_id: str, source_path: Path, content: str) -> bool:
         """Execute an approved Odoo action (invoice/payment) via JSON-RPC."""
         self.log(f"Executing Odoo action: {item_id}")
@@ -239,17 +462,53 @@ class ApprovalExecutor:
 
         return True
 
-    def check_queue(self):
-        """Check and process all items in the queue"""
-        queue_files = list(self.queue_path.glob('execute_*.json'))
+    def check_queue(self) -> int:
+        """
+        Check and process new items in the queue, oldest first (up to QUEUE_BATCH_SIZE)
+
+        Returns how many items were handled (executed, or moved to Failed).
+        """
+        handled_count = 0
+        queue_files = []
+        with os.scandir(self.queue_path) as entries:
+            for entry in entries:
+                if not (entry.name.startswith('execute_') and entry.name.endswith('.json')):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime_ns
+                except FileNotFoundError:
+                    continue
+                seen = self._processed.get(entry.name)
+                if seen is None or seen[0] != mtime:
+                    queue_files.append((mtime, entry.name, Path(entry.path)))
 
         if queue_files:
             self.log(f"Found {len(queue_files)} items in queue")
 
-            for queue_file in queue_files:
-                self.process_queue_item(queue_file)
-
-        return len(queue_files)
+            queue_files.sort()
+            del queue_files[QUEUE_BATCH_SIZE:]
+            sends = [self.process_queue_item(queue_file) for _, _, queue_file in queue_files]
+
+            # Wait for this batch's emails so the caller sees the queue drained
+            wait([send for send in sends if send is not None])
+            handled_at = time.monotonic()
+            handled, self._handled_names = self._handled_names, set()
+            for mtime, name, _ in queue_files:
+                if name in handled:
+                    self._processed[name] = (mtime, handled_at)
+                    handled_count += 1
+
+        self._prune_processed()
+        return handled_count
+
+    def _prune_processed(self):
+        """Forget handled queue files older than PROCESSED_TTL (checked at most once per TTL)"""
+        now = time.monotonic()
+        if now - self._processed_pruned < PROCESSED_TTL:
+            return
+        self._processed_pruned = now
+        self._processed = {name: seen for name, seen in self._processed.items()
+                           if now - seen[1] < PROCESSED_TTL}
 
     def run_once(self):
         """Run a single check"""
@@ -258,24 +517,59 @@ class ApprovalExecutor:
         if count == 0:
             self.log("Queue is empty")
 
+    def _start_queue_observer(self, wakeup: threading.Event):
+        """Watch the queue folder so new items are executed right away (needs watchdog)"""
+        if not WATCHDOG_AVAILABLE:
+            return None
+        try:
+            observer = Observer()
+            observer.schedule(_QueueWakeup(wakeup), str(self.queue_path))
+            observer.start()
+            return observer
+        except Exception as e:
+            self.log(f"Queue watch unavailable, polling only: {e}", 'WARNING')
+            return None
+
     def run(self, interval: int = 10):
-        """Run continuously"""
+        """
+        Run continuously
+
+        With watchdog installed, queue file events wake the loop at once and
+        the queue is only re-checked as a fallback every
+        max(interval, WATCHED_RESCAN_SECONDS); otherwise it is polled every
+        interval seconds.
+        """
         self.log(f"Starting Approval Executor (checking every {interval}s)")
 
-        while True:
-            try:
-                self.check_queue()
-            except Exception as e:
-                self.log(f"Error in main loop: {e}", 'ERROR')
+        wakeup = threading.Event()
+        observer = self._start_queue_observer(wakeup)
+        if observer is not None:
+            self.log("Watching queue folder for new items")
+            interval = max(interval, WATCHED_RESCAN_SECONDS)
 
-            time.sleep(interval)
+        try:
+            while True:
+                try:
+                    if self.check_queue() > 0:
+                        # Items were handled, so more may be waiting; check again right away
+                        continue
+                except Exception as e:
+                    self.log(f"Error in main loop: {e}", 'ERROR')
+
+                if wakeup.wait(interval):
+                    time.sleep(QUEUE_EVENT_DEBOUNCE)
+                wakeup.clear()
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
 
 
 def main():
     """Main entry point"""
     import sys
 
-    load_dotenv()
+    ensure_env()
 
     vault_path = os.getenv('VAULT_PATH', str(Path(__file__).parent.parent))
 
@@ -18,15 +18,116 @@ WHY THIS MATTERS:
 - You stay in control!
 """
 
+import os
 import time
 import re
-import shutil
+import sqlite3
 import logging
+import threading
+import itertools
+from collections import OrderedDict, deque
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Callable
 from enum import Enum
 
+import frontmatter_util
+
+try:
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# After a file event in /Pending_Approval, wait this long so the editor can
+# finish saving and bursts of events coalesce
+PENDING_EVENT_DEBOUNCE = 0.05
+
+# While file events are being delivered, the full folder scan only catches
+# missed events, so it runs at most this often
+WATCHED_RESCAN_SECONDS = 300
+
+# Changed files re-read per wake-up, and how many may wait before the
+# monitor gives up tracking them one by one and rescans the folder
+PENDING_BATCH_SIZE = 64
+PENDING_DIRTY_MAX = 1024
+
+# In-memory file memos are bounded, least recently used first out: mtimes of
+# undecided files, and recently decided files kept in front of the database
+PENDING_MTIMES_MAX = 10_000
+PROCESSED_CACHE_SIZE = 1024
+
+# Checked action boxes (or a status line) in an approval file, any case; the
+# named group says which decision matched
+STATUS_RE = re.compile(
+    r'(?P<approve>\[x\]\s*\*?\*?approve|\[x\]\s*✅\s*approve|status:\s*approved)'
+    r'|(?P<reject>\[x\]\s*\*?\*?reject|\[x\]\s*❌\s*reject|status:\s*rejected)'
+    r'|(?P<edit>\[x\]\s*\*?\*?edit|\[x\]\s*✏️\s*edit|status:\s*needs_edit)',
+    re.IGNORECASE
+)
+
+# One entry in the daily approvals log (reason line only when given); the
+# handler's formatter adds the "## HH:MM:SS - " heading
+APPROVAL_LOG_TEMPLATE = "{filename}\n- **Status:** {status}\n- **Type:** {action_type}\n{reason_line}"
+APPROVAL_LOG_FORMAT = "\n## %(asctime)s - %(message)s"
+
+# Heading of the checkbox section written by create_approval_request
+ACTIONS_HEADING = '## Actions'
+
+# Approval request file written by create_approval_request
+APPROVAL_REQUEST_TEMPLATE = """---
+type: {action_type}
+created: {created}
+status: pending_approval
+{extra_meta}---
+
+# {title}
+
+{content}
+
+---
+
+{actions_heading}
+
+- [ ] **APPROVE** - Execute this action
+- [ ] **REJECT** - Do not execute
+- [ ] **EDIT** - Modify before approving
+
+{suggested}---
+
+*Created by AI Employee at {created_at}*
+*Awaiting human approval*
+"""
+
+# "Reason: ...", "Rejection reason: ...", "Rejected because: ..." or a "## Reason" section
+REJECTION_REASON_RE = re.compile(r'reason:\s*(.+)|rejected because:\s*(.+)|## reason\n(.+)', re.IGNORECASE)
+
+
+# (epoch second, ISO string) of the last formatted timestamp
+_iso_cached = (0, '')
+
+
+def _iso_now() -> str:
+    """Current local time in ISO format to the second, formatted at most once per second"""
+    global _iso_cached
+    second = int(time.time())
+    cached = _iso_cached
+    if cached[0] != second:
+        cached = _iso_cached = (second, datetime.fromtimestamp(second).isoformat())
+    return cached[1]
+
+
+def _write_new_file(path: str, data: bytes, dir_fd: Optional[int] = None):
+    """Create (or truncate) a file and write bytes with plain os calls, no text layer"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644, dir_fd=dir_fd)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -42,6 +143,94 @@ class ApprovalStatus(Enum):
     NEEDS_EDIT = "needs_edit"
 
 
+class _DailyFileHandler(logging.FileHandler):
+    """FileHandler appending to <prefix>YYYYMMDD<suffix> for the day of each record"""
+
+    def __init__(self, folder: Path, prefix: str, suffix: str):
+        self.folder = Path(folder)
+        self.prefix = prefix
+        self.suffix = suffix
+        self.day = time.strftime('%Y%m%d')
+        super().__init__(self._path(self.day), encoding='utf-8', delay=True)
+
+    def _path(self, day: str) -> str:
+        return str(self.folder / f'{self.prefix}{day}{self.suffix}')
+
+    def emit(self, record: logging.LogRecord):
+        # Called with the handler lock held; switch files when the day changes
+        day = time.strftime('%Y%m%d', time.localtime(record.created))
+        if day != self.day:
+            if self.stream is not None:
+                self.stream.close()
+                self.stream = None
+            self.day = day
+            self.baseFilename = os.path.abspath(self._path(day))
+        super().emit(record)
+
+
+class _ActionHandler:
+    """A registered action handler: the callable plus the action type it serves"""
+
+    __slots__ = ('name', 'invoke')
+
+    def __init__(self, name: str, invoke: Callable):
+        self.name = name
+        self.invoke = invoke
+
+    def __call__(self, approved_path: Path, content: str):
+        return self.invoke(approved_path, content)
+
+
+class _PendingChanges:
+    """watchdog handler that collects changed approval files and wakes the monitor"""
+
+    def __init__(self):
+        self.wakeup = threading.Event()
+        self._lock = threading.Lock()
+        # Changed files in arrival order, with a set to skip duplicates
+        self._dirty = deque()
+        self._queued = set()
+        self._overflowed = False
+
+    def dispatch(self, event):
+        if event.is_directory or event.event_type == 'deleted':
+            return
+        path = getattr(event, 'dest_path', '') or event.src_path
+        if path.endswith('.md'):
+            path = Path(path)
+            with self._lock:
+                if path not in self._queued:
+                    if len(self._dirty) >= PENDING_DIRTY_MAX:
+                        self._overflowed = True
+                    else:
+                        self._dirty.append(path)
+                        self._queued.add(path)
+            self.wakeup.set()
+
+    def pending(self) -> bool:
+        """Whether changed files are still waiting to be taken"""
+        with self._lock:
+            return bool(self._dirty) or self._overflowed
+
+    def take(self, limit: int = PENDING_BATCH_SIZE) -> Optional[List[Path]]:
+        """
+        Return up to limit changed files, oldest change first, or None if
+        too many changes piled up and the whole folder should be rescanned
+        """
+        with self._lock:
+            self.wakeup.clear()
+            if self._overflowed:
+                self._overflowed = False
+                self._dirty.clear()
+                self._queued.clear()
+                return None
+            paths = [self._dirty.popleft() for _ in range(min(limit, len(self._dirty)))]
+            self._queued.difference_update(paths)
+            if self._dirty:
+                self.wakeup.set()
+        return paths
+
+
 class ApprovalWorkflow:
     """
     Manages the human-in-the-loop approval process.
@@ -71,21 +260,94 @@ class ApprovalWorkflow:
             folder.mkdir(parents=True, exist_ok=True)
 
         # Action handlers (registered by other components)
-        self.action_handlers: Dict[str, Callable] = {}
+        self.action_handlers: Dict[str, _ActionHandler] = {}
+
+        # Track processed files: (name, mtime_ns, status) rows in a small sqlite
+        # database, so a restart remembers them and memory doesn't grow
+        self.state_db_path = self.vault_path / '.approval_state.db'
+        self._db = self._open_state_db()
+        self._unsaved: List[tuple] = []
+        self._recent_processed: 'OrderedDict[str, int]' = OrderedDict()
+
+        # Markdown audit trail of decisions, rotated at midnight
+        self.audit_logger = self._make_audit_logger()
 
-        # Track processed files
-        self.processed_files = set()
+        # Files still awaiting a decision: name -> mtime_ns when last read, so
+        # an untouched file is not read and parsed again on every check
+        self._pending_mtimes: 'OrderedDict[str, int]' = OrderedDict()
 
         logger.info(f"Approval Workflow initialized for vault: {vault_path}")
 
+    def _make_audit_logger(self) -> logging.Logger:
+        """
+        Logger writing decisions to Logs/Approvals/approvals_YYYYMMDD.md
+
+        The handler keeps the day's file open and moves on to the next
+        day's file at midnight.
+        """
+        handler = _DailyFileHandler(self.logs_folder, 'approvals_', '.md')
+        handler.setFormatter(logging.Formatter(APPROVAL_LOG_FORMAT, datefmt='%H:%M:%S'))
+
+        # Not registered by name, so each vault gets its own logger and the
+        # entries don't propagate to the console handler
+        audit_logger = logging.Logger('ApprovalWorkflow.audit')
+        audit_logger.addHandler(handler)
+        return audit_logger
+
+    def _open_state_db(self) -> sqlite3.Connection:
+        """
+        Open (creating if needed) the processed-files database
+
+        The monitor may run on a different thread than the one that built
+        the workflow; _db_lock keeps uses of the connection one at a time.
+        """
+        self._db_lock = threading.Lock()
+        db = sqlite3.connect(str(self.state_db_path), check_same_thread=False)
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('CREATE TABLE IF NOT EXISTS processed '
+                   '(name TEXT PRIMARY KEY, mtime INTEGER NOT NULL, status TEXT NOT NULL)')
+        db.commit()
+        return db
+
+    def _is_processed(self, name: str, mtime: int) -> bool:
+        """Whether this exact file (same name and mtime) was already approved or rejected"""
+        if self._recent_processed.get(name) == mtime:
+            return True
+        with self._db_lock:
+            row = self._db.execute('SELECT mtime FROM processed WHERE name = ?', (name,)).fetchone()
+        return row is not None and row[0] == mtime
+
+    def _save_processed(self):
+        """Write files processed since the last save in one transaction"""
+        if not self._unsaved:
+            return
+        for name, mtime, _ in self._unsaved:
+            self._remember(self._recent_processed, name, mtime, PROCESSED_CACHE_SIZE)
+        with self._db_lock, self._db:
+            self._db.executemany('INSERT OR REPLACE INTO processed (name, mtime, status) VALUES (?, ?, ?)',
+                                 self._unsaved)
+        self._unsaved = []
+
+    @staticmethod
+    def _remember(memo: OrderedDict, name: str, mtime: int, limit: int):
+        """Record name -> mtime as most recently used, evicting the oldest past limit"""
+        memo[name] = mtime
+        memo.move_to_end(name)
+        if len(memo) > limit:
+            memo.popitem(last=False)
+
     def register_action_handler(self, action_type: str, handler: Callable):
         """
         Register a handler function for a specific action type.
 
+        The handler is called as handler(approved_path, content), where
+        content is the file text already read for the approval check, so
+        handlers should use it rather than reading the file again.
+
         Example:
             workflow.register_action_handler('email_draft', email_server.send_approved_email)
         """
-        self.action_handlers[action_type] = handler
+        self.action_handlers[action_type] = _ActionHandler(action_type, handler)
         logger.info(f"Registered handler for action type: {action_type}")
 
     def check_for_approvals(self) -> List[Dict[str, Any]]:
@@ -97,35 +359,70 @@ class ApprovalWorkflow:
         - OR checking [x] **REJECT** in the file
         """
         results = []
+        present = set()
 
-        pending_files = list(self.pending_folder.glob('*.md'))
+        with os.scandir(self.pending_folder) as entries:
+            pending = [entry for entry in entries if entry.name.endswith('.md') and entry.is_file()]
 
-        for filepath in pending_files:
-            if filepath.name in self.processed_files:
+        for entry in pending:
+            present.add(entry.name)
+            try:
+                mtime = entry.stat().st_mtime_ns
+            except FileNotFoundError:
                 continue
+            result = self._process_file(Path(entry.path), mtime)
+            if result is not None:
+                results.append(result)
 
-            try:
-                content = filepath.read_text()
-                status = self._detect_approval_status(content)
+        # Forget files that have left the folder
+        for name in self._pending_mtimes.keys() - present:
+            del self._pending_mtimes[name]
+
+        self._save_processed()
+        return results
+
+    def _process_file(self, filepath: Path, mtime: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Act on one pending file if it has been approved or rejected; returns the result
 
+        Unchanged files (same mtime as when last found undecided) are skipped
+        without reading them; only changed files are looked up in the
+        processed-files database. Callers save new rows with _save_processed.
+        """
+        try:
+            if mtime is None:
+                mtime = filepath.stat().st_mtime_ns
+            if self._pending_mtimes.get(filepath.name) == mtime:
+                return None
+            if self._is_processed(filepath.name, mtime):
+                return None
+
+            content = filepath.read_text()
+            status = self._detect_approval_status(content)
+
+            if status in (ApprovalStatus.APPROVED, ApprovalStatus.REJECTED):
                 if status == ApprovalStatus.APPROVED:
                     result = self._handle_approval(filepath, content)
-                    results.append(result)
-
-                elif status == ApprovalStatus.REJECTED:
+                else:
                     result = self._handle_rejection(filepath, content)
-                    results.append(result)
+                self._unsaved.append((filepath.name, mtime, result['status']))
+                self._pending_mtimes.pop(filepath.name, None)
+                return result
 
-                elif status == ApprovalStatus.NEEDS_EDIT:
-                    # Keep in pending, but log that edit was requested
-                    logger.info(f"Edit requested for: {filepath.name}")
+            elif status == ApprovalStatus.NEEDS_EDIT:
+                # Keep in pending, but log that edit was requested
+                logger.info(f"Edit requested for: {filepath.name}")
 
-                # PENDING status means no action taken yet
+            # PENDING status means no action taken yet
+            self._remember(self._pending_mtimes, filepath.name, mtime, PENDING_MTIMES_MAX)
 
-            except Exception as e:
-                logger.error(f"Error processing {filepath}: {e}")
+        except FileNotFoundError:
+            # Moved or deleted since it was listed or reported changed
+            self._pending_mtimes.pop(filepath.name, None)
+        except Exception as e:
+            logger.error(f"Error processing {filepath}: {e}")
 
-        return results
+        return None
 
     def _detect_approval_status(self, content: str) -> ApprovalStatus:
         """
@@ -135,40 +432,32 @@ class ApprovalWorkflow:
         - [x] **APPROVE** or [x] APPROVE
         - [x] **REJECT** or [x] REJECT
         - [x] **EDIT** or [x] EDIT
-        """
-        content_lower = content.lower()
 
-        # Check for approval (various formats)
-        approve_patterns = [
-            r'\[x\]\s*\*?\*?approve\*?\*?',
-            r'\[x\]\s*✅\s*approve',
-            r'status:\s*approved'
-        ]
-        for pattern in approve_patterns:
-            if re.search(pattern, content_lower):
-                return ApprovalStatus.APPROVED
-
-        # Check for rejection
-        reject_patterns = [
-            r'\[x\]\s*\*?\*?reject\*?\*?',
-            r'\[x\]\s*❌\s*reject',
-            r'status:\s*rejected'
-        ]
-        for pattern in reject_patterns:
-            if re.search(pattern, content_lower):
-                return ApprovalStatus.REJECTED
-
-        # Check for edit request
-        edit_patterns = [
-            r'\[x\]\s*\*?\*?edit\*?\*?',
-            r'\[x\]\s*✏️\s*edit',
-            r'status:\s*needs_edit'
-        ]
-        for pattern in edit_patterns:
-            if re.search(pattern, content_lower):
-                return ApprovalStatus.NEEDS_EDIT
+        Everything is found in one scan. If several are checked, approve
+        wins over reject, and reject over edit.
 
-        return ApprovalStatus.PENDING
+        Files made by create_approval_request keep the status line in the
+        frontmatter and the boxes under "## Actions", so only those two
+        slices are scanned, not the (possibly long) draft in between.
+        """
+        actions = content.rfind(ACTIONS_HEADING)
+        if actions == -1:
+            matches = STATUS_RE.finditer(content)
+        else:
+            frontmatter_end = content.find('\n---', 4) if content.startswith('---\n') else -1
+            matches = itertools.chain(STATUS_RE.finditer(content, 0, max(frontmatter_end, 0)),
+                                      STATUS_RE.finditer(content, actions))
+
+        status = ApprovalStatus.PENDING
+        for match in matches:
+            decision = match.lastgroup
+            if decision == 'approve':
+                return ApprovalStatus.APPROVED
+            if decision == 'reject':
+                status = ApprovalStatus.REJECTED
+            elif status == ApprovalStatus.PENDING:
+                status = ApprovalStatus.NEEDS_EDIT
+        return status
 
     def _handle_approval(self, filepath: Path, content: str) -> Dict[str, Any]:
         """Handle an approved action."""
@@ -179,7 +468,8 @@ class ApprovalWorkflow:
 
         # Move to approved folder
         approved_path = self.approved_folder / filepath.name
-        shutil.move(str(filepath), str(approved_path))
+        # Same vault, same filesystem: a plain rename (replacing any stale copy)
+        filepath.replace(approved_path)
 
         # Log the approval
         self._log_action(filepath.name, 'approved', action_type)
@@ -190,17 +480,18 @@ class ApprovalWorkflow:
             "status": "approved",
             "action_type": action_type,
             "approved_path": str(approved_path),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _iso_now()
         }
 
-        if action_type in self.action_handlers:
+        handler = self.action_handlers.get(action_type)
+        if handler is not None:
             try:
-                handler_result = self.action_handlers[action_type](approved_path, content)
+                handler_result = handler.invoke(approved_path, content)
                 result["action_result"] = handler_result
 
                 # Move to done after successful execution
                 done_path = self.done_folder / filepath.name
-                shutil.move(str(approved_path), str(done_path))
+                approved_path.replace(done_path)
                 result["final_path"] = str(done_path)
 
             except Exception as e:
@@ -210,7 +501,6 @@ class ApprovalWorkflow:
             logger.warning(f"No handler registered for action type: {action_type}")
             result["action_result"] = "No handler - manual execution required"
 
-        self.processed_files.add(filepath.name)
         return result
 
     def _handle_rejection(self, filepath: Path, content: str) -> Dict[str, Any]:
@@ -222,7 +512,7 @@ class ApprovalWorkflow:
         action_type = self._extract_frontmatter_value(content, 'type')
 
         # Add rejection metadata to content
-        rejection_note = f"\n\n---\n**REJECTED:** {datetime.now().isoformat()}\n"
+        rejection_note = f"\n\n---\n**REJECTED:** {_iso_now()}\n"
         if reason:
             rejection_note += f"**Reason:** {reason}\n"
 
@@ -236,63 +526,35 @@ class ApprovalWorkflow:
         # Log the rejection
         self._log_action(filepath.name, 'rejected', action_type, reason)
 
-        self.processed_files.add(filepath.name)
-
         return {
             "file": filepath.name,
             "status": "rejected",
             "action_type": action_type,
             "reason": reason,
             "rejected_path": str(rejected_path),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _iso_now()
         }
 
     def _extract_frontmatter_value(self, content: str, key: str) -> Optional[str]:
         """Extract a value from YAML frontmatter."""
-        pattern = rf'^{key}:\s*(.+)$'
-        match = re.search(pattern, content, re.MULTILINE)
-        if match:
-            return match.group(1).strip()
-        return None
+        return frontmatter_util.parse(content)[0].get(key) or None
 
     def _extract_rejection_reason(self, content: str) -> Optional[str]:
         """Try to extract rejection reason from content."""
-        # Look for common patterns
-        patterns = [
-            r'reason:\s*(.+)',
-            r'rejection reason:\s*(.+)',
-            r'rejected because:\s*(.+)',
-            r'## reason\n(.+)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-
+        match = REJECTION_REASON_RE.search(content)
+        if match:
+            return next(group for group in match.groups() if group is not None).strip()
         return None
 
     def _log_action(self, filename: str, status: str, action_type: str,
                     reason: str = None):
         """Log approval/rejection for audit trail."""
-        log_entry = {
-            "filename": filename,
-            "status": status,
-            "action_type": action_type,
-            "reason": reason,
-            "timestamp": datetime.now().isoformat()
-        }
-
-        # Append to daily log
-        daily_log = self.logs_folder / f'approvals_{datetime.now().strftime("%Y%m%d")}.md'
-
-        with open(daily_log, 'a') as f:
-            f.write(f"\n## {datetime.now().strftime('%H:%M:%S')} - {filename}\n")
-            f.write(f"- **Status:** {status.upper()}\n")
-            f.write(f"- **Type:** {action_type}\n")
-            if reason:
-                f.write(f"- **Reason:** {reason}\n")
-            f.write("\n")
+        self.audit_logger.info(APPROVAL_LOG_TEMPLATE.format(
+            filename=filename,
+            status=status.upper(),
+            action_type=action_type,
+            reason_line=f"- **Reason:** {reason}\n" if reason else ''
+        ))
 
         logger.info(f"Logged {status} for {filename}")
 
@@ -313,63 +575,145 @@ class ApprovalWorkflow:
         Returns:
             Path to the created approval request file
         """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
         filename = f'{action_type.upper()}_{timestamp}.md'
         filepath = self.pending_folder / filename
 
-        # Build frontmatter
-        frontmatter = f'''---
-type: {action_type}
-created: {datetime.now().isoformat()}
-status: pending_approval
-'''
-        if metadata:
-            for key, value in metadata.items():
-                frontmatter += f'{key}: {value}\n'
-        frontmatter += '---\n\n'
-
-        # Build content
-        file_content = frontmatter
-        file_content += f'# {title}\n\n'
-        file_content += content
-        file_content += '\n\n---\n\n'
-        file_content += '## Actions\n\n'
-        file_content += '- [ ] **APPROVE** - Execute this action\n'
-        file_content += '- [ ] **REJECT** - Do not execute\n'
-        file_content += '- [ ] **EDIT** - Modify before approving\n\n'
+        file_content = self._render_approval_request(action_type, title, content,
+                                                     suggested_actions, metadata)
 
-        if suggested_actions:
-            file_content += '## What Will Happen If Approved\n\n'
-            for action in suggested_actions:
-                file_content += f'- {action}\n'
-            file_content += '\n'
-
-        file_content += '---\n\n'
-        file_content += f'*Created by AI Employee at {datetime.now().strftime("%Y-%m-%d %H:%M")}*\n'
-        file_content += '*Awaiting human approval*\n'
-
-        filepath.write_text(file_content)
+        _write_new_file(str(filepath), file_content.encode('utf-8'))
         logger.info(f"Created approval request: {filepath}")
 
         return filepath
 
+    def create_approval_requests(self, requests: List[Dict[str, Any]]) -> List[Path]:
+        """
+        Create several approval requests in one pass.
+
+        Each item holds create_approval_request's keyword arguments. All
+        files are rendered first, then written relative to one open handle
+        on /Pending_Approval where the OS supports it. Names get a sequence
+        number so a burst within one second doesn't collide.
+
+        Returns:
+            Paths to the created approval request files, in order
+        """
+        timestamp = time.strftime('%Y%m%d_%H%M%S')
+        rendered = [
+            (f'{request["action_type"].upper()}_{timestamp}_{index:03d}.md',
+             self._render_approval_request(**request).encode('utf-8'))
+            for index, request in enumerate(requests)
+        ]
+
+        dir_fd = None
+        if os.open in os.supports_dir_fd:
+            dir_fd = os.open(self.pending_folder, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+
+        paths = []
+        try:
+            for filename, data in rendered:
+                target = filename if dir_fd is not None else str(self.pending_folder / filename)
+                _write_new_file(target, data, dir_fd)
+                paths.append(self.pending_folder / filename)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+        logger.info(f"Created {len(paths)} approval requests in {self.pending_folder}")
+        return paths
+
+    def _render_approval_request(self, action_type: str, title: str, content: str,
+                                 suggested_actions: List[str] = None,
+                                 metadata: Dict[str, Any] = None) -> str:
+        """Markdown text of an approval request"""
+        suggested = ''
+        if suggested_actions:
+            suggested = ('## What Will Happen If Approved\n\n'
+                         + ''.join(f'- {action}\n' for action in suggested_actions) + '\n')
+
+        return APPROVAL_REQUEST_TEMPLATE.format_map({
+            'action_type': action_type,
+            'created': _iso_now(),
+            'extra_meta': ''.join(f'{key}: {value}\n' for key, value in (metadata or {}).items()),
+            'title': title,
+            'content': content,
+            'actions_heading': ACTIONS_HEADING,
+            'suggested': suggested,
+            'created_at': time.strftime('%Y-%m-%d %H:%M'),
+        })
+
+    def _start_observer(self, changes: _PendingChanges):
+        """Watch /Pending_Approval (not its parent) for saved files (needs watchdog)"""
+        if not WATCHDOG_AVAILABLE:
+            return None
+        try:
+            observer = Observer()
+            observer.schedule(changes, str(self.pending_folder))
+            observer.start()
+            return observer
+        except Exception as e:
+            logger.warning(f"File watch unavailable, polling only: {e}")
+            return None
+
     def run(self):
         """
         Run the approval workflow monitor continuously.
+
+        With watchdog installed, only files reported changed are re-read, as
+        soon as they are saved, PENDING_BATCH_SIZE at a time; the full folder
+        scan every max(check_interval, WATCHED_RESCAN_SECONDS) (or after an
+        event flood) is just a fallback. Without it the folder is polled
+        every check_interval as before.
         """
         logger.info("Starting Approval Workflow monitor...")
         logger.info(f"Monitoring: {self.pending_folder}")
         logger.info(f"Check interval: {self.check_interval} seconds")
 
-        while True:
-            try:
-                results = self.check_for_approvals()
-                for result in results:
-                    logger.info(f"Processed: {result}")
-            except Exception as e:
-                logger.error(f"Error in approval check: {e}")
-
-            time.sleep(self.check_interval)
+        changes = _PendingChanges()
+        observer = self._start_observer(changes)
+        rescan_interval = self.check_interval
+        if observer is not None:
+            logger.info("Watching for saved approval files")
+            rescan_interval = max(rescan_interval, WATCHED_RESCAN_SECONDS)
+
+        try:
+            changed = None
+            while True:
+                try:
+                    if changed is None:
+                        results = self.check_for_approvals()
+                    else:
+                        results = [result for result in map(self._process_file, changed)
+                                   if result is not None]
+                        self._save_processed()
+                    for result in results:
+                        logger.info(f"Processed: {result}")
+                except Exception as e:
+                    logger.error(f"Error in approval check: {e}")
+
+                if changes.pending():
+                    # More changes than one batch; keep going without waiting
+                    changed = changes.take()
+                    continue
+
+                changed = None
+                if changes.wakeup.wait(rescan_interval):
+                    time.sleep(PENDING_EVENT_DEBOUNCE)
+                    changed = changes.take()
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+            self.close()
+
+    def close(self):
+        """Close the audit log file and the processed-files database"""
+        for handler in self.audit_logger.handlers:
+            handler.close()
+        self._save_processed()
+        with self._db_lock:
+            self._db.close()
 
 
 def demo_approval_workflow(vault_path: str):
@@ -3,6 +3,7 @@ Base Watcher Template
 All specific watchers (Gmail, LinkedIn, etc.) inherit from this base class
 """
 
+import re
 import time
 import logging
 from pathlib import Path
@@ -10,6 +11,13 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import List, Dict, Any
 
+# sanitize_filename keeps letters, digits, spaces, '-' and '_'. ASCII text is
+# filtered with a translate table, anything else with the equivalent regex
+# (\w is exactly isalnum() plus '_')
+FILENAME_ASCII_TABLE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c in ' -_')))
+FILENAME_UNSAFE_RE = re.compile(r'[^\w \-]')
+
 
 class BaseWatcher(ABC):
     """
@@ -114,7 +122,10 @@ class BaseWatcher(ABC):
             Sanitized filename
         """
         # Remove special characters
-        safe = "".join(c for c in text if c.isalnum() or c in (' ', '-', '_'))
+        if text.isascii():
+            safe = text.translate(FILENAME_ASCII_TABLE)
+        else:
+            safe = FILENAME_UNSAFE_RE.sub('', text)
         # Replace spaces with underscores
         safe = safe.replace(' ', '_')
         # Truncate if too long
@@ -4,6 +4,7 @@ Sends approved email replies via Gmail SMTP
 """
 
 import os
+import asyncio
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -11,6 +12,36 @@ from datetime import datetime
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    import aiosmtplib
+    AIOSMTPLIB_AVAILABLE = True
+except ImportError:
+    AIOSMTPLIB_AVAILABLE = False
+
+# Most aiosmtplib connections open at once per sender; sends beyond this wait
+ASYNC_SMTP_CONNECTIONS = 4
+
+# An aiosmtplib connection is closed after this many messages, to respect provider limits
+MAX_MESSAGES_PER_CONNECTION = 100
+
+_env_loaded = False
+
+
+def ensure_env():
+    """Load .env into the environment once per process"""
+    global _env_loaded
+    if not _env_loaded:
+        load_dotenv()
+        _env_loaded = True
+
+
+async def _quit_async_smtp(smtp):
+    """Politely end an aiosmtplib session, closing the socket if QUIT fails"""
+    try:
+        await smtp.quit()
+    except Exception:
+        smtp.close()
+
 
 class EmailSender:
     """
@@ -18,7 +49,7 @@ class EmailSender:
     """
 
     def __init__(self):
-        load_dotenv()
+        ensure_env()
 
         self.email_user = os.getenv('EMAIL_USER')
         self.email_pass = os.getenv('EMAIL_PASS', '').replace(' ', '')
@@ -29,6 +60,22 @@ class EmailSender:
         self.smtp_server = 'smtp.gmail.com'
         self.smtp_port = 587
 
+        # Idle authenticated aiosmtplib connections kept open between async
+        # sends as (connection, messages sent), and the limit on open ones;
+        # both are bound to the event loop that made them
+        self._async_idle = []
+        self._async_slots = None
+        self._async_loop = None
+
+    def _build_message(self, to: str, subject: str, body: str, html: bool = False) -> MIMEMultipart:
+        """Build the outgoing message"""
+        msg = MIMEMultipart('alternative')
+        msg['From'] = self.email_user
+        msg['To'] = to
+        msg['Subject'] = subject
+        msg.attach(MIMEText(body, 'html' if html else 'plain'))
+        return msg
+
     def send_email(self, to: str, subject: str, body: str, html: bool = False) -> bool:
         """
         Send an email
@@ -44,16 +91,7 @@ class EmailSender:
         """
         try:
             # Create message
-            msg = MIMEMultipart('alternative')
-            msg['From'] = self.email_user
-            msg['To'] = to
-            msg['Subject'] = subject
-
-            # Attach body
-            if html:
-                msg.attach(MIMEText(body, 'html'))
-            else:
-                msg.attach(MIMEText(body, 'plain'))
+            msg = self._build_message(to, subject, body, html)
 
             # Connect and send
             with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
@@ -75,6 +113,98 @@ class EmailSender:
         subject = original_subject if original_subject.startswith('Re:') else f"Re: {original_subject}"
         return self.send_email(to, subject, body)
 
+    async def asend_email(self, to: str, subject: str, body: str, html: bool = False) -> bool:
+        """
+        Async variant of send_email (needs aiosmtplib)
+
+        Each send borrows one of up to ASYNC_SMTP_CONNECTIONS authenticated
+        connections, which stay open for later calls, so concurrent sends
+        go out in parallel without a TLS handshake and login per email.
+        """
+        try:
+            msg = self._build_message(to, subject, body, html)
+            smtp, sent = await self._acquire_async_smtp()
+            try:
+                await smtp.send_message(msg)
+            except Exception:
+                await self._release_async_smtp(smtp, sent, discard=True)
+                raise
+            await self._release_async_smtp(smtp, sent + 1)
+
+            print(f"[SUCCESS] Email sent to {to}")
+            return True
+
+        except Exception as e:
+            print(f"[ERROR] Failed to send email: {e}")
+            return False
+
+    async def areply_to_email(self, to: str, original_subject: str, body: str) -> bool:
+        """Async variant of reply_to_email"""
+        subject = original_subject if original_subject.startswith('Re:') else f"Re: {original_subject}"
+        return await self.asend_email(to, subject, body)
+
+    async def _acquire_async_smtp(self):
+        """
+        Borrow an idle aiosmtplib connection, or open one if under the limit
+
+        Returns (connection, messages already sent on it).
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._async_loop:
+            # Connections and the semaphore belong to the loop that made them
+            self._drop_async_idle()
+            self._async_loop = loop
+            self._async_slots = asyncio.Semaphore(ASYNC_SMTP_CONNECTIONS)
+
+        await self._async_slots.acquire()
+        try:
+            while self._async_idle:
+                smtp, sent = self._async_idle.pop()
+                if smtp.is_connected:
+                    return smtp, sent
+
+            smtp = aiosmtplib.SMTP(hostname=self.smtp_server, port=self.smtp_port, start_tls=True)
+            await smtp.connect()
+            try:
+                await smtp.login(self.email_user, self.email_pass)
+            except Exception:
+                smtp.close()
+                raise
+            return smtp, 0
+        except BaseException:
+            self._async_slots.release()
+            raise
+
+    async def _release_async_smtp(self, smtp, sent: int, discard: bool = False):
+        """Return a borrowed connection; it is closed if discard or it reached MAX_MESSAGES_PER_CONNECTION"""
+        try:
+            if discard:
+                smtp.close()
+            elif sent >= MAX_MESSAGES_PER_CONNECTION:
+                await _quit_async_smtp(smtp)
+            else:
+                self._async_idle.append((smtp, sent))
+        finally:
+            self._async_slots.release()
+
+    def _drop_async_idle(self):
+        """Close idle connections left from an earlier event loop"""
+        idle, self._async_idle = self._async_idle, []
+        for smtp, _ in idle:
+            try:
+                smtp.close()
+            except Exception:
+                pass
+
+    async def aclose(self):
+        """Close the idle aiosmtplib connections"""
+        if asyncio.get_running_loop() is not self._async_loop:
+            self._drop_async_idle()
+            return
+        idle, self._async_idle = self._async_idle, []
+        for smtp, _ in idle:
+            await _quit_async_smtp(smtp)
+
 
 def send_reply(to: str, subject: str, message: str) -> bool:
     """
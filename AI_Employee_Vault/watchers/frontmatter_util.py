@@ -0,0 +1,34 @@
+"""
+Frontmatter Utility
+Splits vault markdown files into their `---` frontmatter fields and body
+"""
+
+from typing import Dict, Tuple
+
+
+def parse(content: str) -> Tuple[Dict[str, str], str]:
+    """
+    Parse the leading `---` frontmatter block of a markdown file
+
+    Returns ({key: value}, body). Only flat `key: value` lines are read;
+    values are kept as stripped strings. Content without a frontmatter
+    block comes back unchanged with an empty dict.
+    """
+    if not content.startswith('---\n'):
+        return {}, content
+
+    end = content.find('\n---', 3)
+    if end == -1:
+        return {}, content
+
+    fields = {}
+    for line in content[4:end].split('\n'):
+        key, sep, value = line.partition(':')
+        if sep:
+            # First occurrence wins, as with a top-down search
+            fields.setdefault(key.strip(), value.strip())
+
+    # Body starts on the line after the closing fence
+    body_start = content.find('\n', end + 4)
+    body = content[body_start + 1:] if body_start != -1 else ''
+    return fields, body
@@ -385,7 +385,10 @@ status: in_progress
         try:
             from approval_executor import ApprovalExecutor
             executor = ApprovalExecutor(str(self.vault_path))
-            self._run_watcher_safely('ApprovalExecutor', executor.run_once)
+            try:
+                self._run_watcher_safely('ApprovalExecutor', executor.run_once)
+            finally:
+                executor.close()
         except ImportError:
             logger.warning("approval_executor not available")
 
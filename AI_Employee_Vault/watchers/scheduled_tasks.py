@@ -294,7 +294,8 @@ class ScheduledTasksRunner:
             folder_path = self.vault_path / folder
             health["folders_exist"][folder] = folder_path.exists()
 
-        # Count errors today
+        # Count errors today (error recovery's JSON array plus the audit
+        # logger's one-event-per-line file)
         error_log = self.vault_path / 'Logs' / 'Errors' / f'errors_{datetime.now().strftime("%Y%m%d")}.json'
         if error_log.exists():
             try:
@@ -303,6 +304,13 @@ class ScheduledTasksRunner:
                     health["errors_today"] = len(errors)
             except:
                 pass
+        audit_error_log = error_log.with_suffix('.jsonl')
+        if audit_error_log.exists():
+            try:
+                with open(audit_error_log, 'rb') as f:
+                    health["errors_today"] += sum(1 for _ in f)
+            except OSError:
+                pass
 
         return health
 
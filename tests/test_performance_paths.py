@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+AI Employee - Performance Path Tests
+====================================
+Covers the pooled, batched and cached code paths (SMTP retries, CRLF
+drafts, the scheduler loop, batch sends, audit checksums, the approval
+state database and failed queue items) without network access.
+
+Usage:
+    python tests/test_performance_paths.py
+"""
+
+import json
+import os
+import shutil
+import smtplib
+import socket
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PASS = 0
+FAIL = 0
+
+VAULT = Path(__file__).parent.parent / "AI_Employee_Vault"
+
+# Senders refuse to start without credentials; nothing here connects
+os.environ.setdefault("EMAIL_USER", "test@example.com")
+os.environ.setdefault("EMAIL_PASS", "test-password")
+
+sys.path.insert(0, str(VAULT))
+sys.path.insert(0, str(VAULT / "watchers"))
+sys.path.insert(0, str(VAULT / "mcp_servers"))
+
+
+def log(status: str, msg: str):
+    global PASS, FAIL
+    if status == "PASS":
+        PASS += 1
+        print(f"  [PASS] {msg}")
+    else:
+        FAIL += 1
+        print(f"  [FAIL] {msg}")
+
+
+def check(condition: bool, msg: str):
+    log("PASS" if condition else "FAIL", msg)
+
+
+class FakeSMTP:
+    """Raises the queued errors in order, then accepts every message."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def sendmail(self, sender, to, payload):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+
+
+class FakeConnection:
+    def __init__(self, smtp: FakeSMTP):
+        self.smtp = smtp
+        self.sent = 0
+
+
+class FakePool:
+    """Hands out connections to one FakeSMTP and records how they come back."""
+
+    def __init__(self, errors):
+        self.smtp = FakeSMTP(errors)
+        self.released = []
+
+    def acquire(self):
+        return FakeConnection(self.smtp)
+
+    def release(self, conn, discard=False):
+        self.released.append(discard)
+
+    def close(self):
+        pass
+
+
+def test_sendmail_retry(tmp: Path):
+    """Test 1: _sendmail retries a dropped connection once and nothing else."""
+    print("\n--- Test 1: SMTP Send Retry ---")
+    from email_server import EmailServer
+    server = EmailServer(str(tmp / "email_retry"))
+
+    cases = [
+        ("disconnect is retried", [smtplib.SMTPServerDisconnected()], None, 2, [True, False]),
+        ("second disconnect is raised", [smtplib.SMTPServerDisconnected()] * 2,
+         smtplib.SMTPServerDisconnected, 2, [True, True]),
+        ("refused recipient is not retried", [smtplib.SMTPRecipientsRefused({})],
+         smtplib.SMTPRecipientsRefused, 1, [False]),
+        ("timeout is not resent", [socket.timeout()], socket.timeout, 1, [True]),
+    ]
+    for label, errors, expected, calls, released in cases:
+        server._pool = FakePool(errors)
+        raised = None
+        try:
+            server._sendmail("to@example.com", b"payload")
+        except Exception as e:
+            raised = type(e)
+        check(raised is expected and server._pool.smtp.calls == calls
+              and server._pool.released == released,
+              f"{label} (sends={server._pool.smtp.calls}, discards={server._pool.released})")
+
+    server._pool = None
+    server.close()
+
+
+def test_send_batch_bad_items(tmp: Path):
+    """Test 2: send_batch reports malformed items instead of raising."""
+    print("\n--- Test 2: Batch Send Validation ---")
+    from email_server import EmailServer
+    vault = tmp / "email_batch"
+    server = EmailServer(str(vault))
+    sent = []
+    server._sendmail = lambda to, payload: sent.append(to)
+
+    result = server.send_batch([
+        {"to": "a@example.com", "subject": "One", "body": "First"},
+        {"to": "b@example.com"},
+        {"to": "c@example.com", "subject": "Two", "body": "Second", "cc": "x"},
+        "not an object",
+        {"to": "d@example.com", "subject": "Three", "body": "Third"},
+    ])
+    server.close()
+
+    check(result["sent"] == 2 and result["failed"] == 3, f"2 sent, 3 failed ({result['sent']}/{result['failed']})")
+    check(sent == ["a@example.com", "d@example.com"], "Only valid items reached SMTP")
+    errors = [r.get("error", "") for r in result["results"]]
+    check(errors[1].startswith("Missing fields") and errors[2].startswith("Unexpected fields")
+          and errors[3] == "Batch item must be an object", "Bad items carry a reason")
+    daily = list((vault / "Logs" / "Email").glob("*.md"))
+    check(len(daily) == 1 and daily[0].read_text().count("a@example.com") == 1, "Daily log written once")
+
+
+def test_crlf_draft(tmp: Path):
+    """Test 3: ApprovalExecutor reads CRLF drafts like LF ones."""
+    print("\n--- Test 3: CRLF Email Draft ---")
+    from approval_executor import ApprovalExecutor
+    vault = tmp / "crlf"
+    vault.mkdir()
+    executor = ApprovalExecutor(str(vault))
+
+    sent = []
+
+    def reply(**kwargs):
+        sent.append(kwargs)
+        return True
+
+    async def areply(**kwargs):
+        return reply(**kwargs)
+
+    executor.email_sender.reply_to_email = reply
+    executor.email_sender.areply_to_email = areply
+
+    draft = vault / "EMAIL_crlf.md"
+    draft.write_bytes(
+        b"---\r\ntype: email_reply\r\nto: client@example.com\r\nsubject: Invoice\r\n---\r\n\r\n"
+        b"**To:** client@example.com\r\n**Subject:** Invoice\r\n\r\n---\r\n\r\n"
+        b"Hello there\r\n\r\n---\r\n"
+    )
+    queue_file = executor.queue_path / "execute_crlf.json"
+    queue_file.write_text(json.dumps({"id": "crlf", "sourcePath": str(draft)}))
+
+    try:
+        executor.check_queue()
+    finally:
+        executor.close()
+
+    check(len(sent) == 1, f"One email sent ({len(sent)})")
+    if sent:
+        check(sent[0]["to"] == "client@example.com" and sent[0]["original_subject"] == "Invoice",
+              "Recipient and subject parsed")
+        check(sent[0]["body"] == "Hello there", f"Body has no stray CR: {sent[0]['body']!r}")
+    check(not queue_file.exists(), "Queue item removed after send")
+
+
+def test_empty_schedule_loop(tmp: Path):
+    """Test 4: run_continuous keeps waiting when no task is enabled."""
+    print("\n--- Test 4: Empty Schedule Loop ---")
+    import scheduler
+    vault = tmp / "schedule"
+    vault.mkdir()
+    schedule_file = vault / ".schedule.json"
+    task = {"name": "digest", "command": "true", "interval_minutes": 5, "enabled": False}
+    schedule_file.write_text(json.dumps({"tasks": [task]}))
+
+    sched = scheduler.TaskScheduler(str(vault))
+    ran = []
+    sched.run_task = lambda t: ran.append(t["name"]) or True
+
+    class Stop(Exception):
+        pass
+
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) == 2:
+            # Enable the task while the loop is idle; bump the mtime so the
+            # reload is seen even on coarse filesystem clocks
+            task["enabled"] = True
+            schedule_file.write_text(json.dumps({"tasks": [task]}))
+            later = time.time() + 1
+            os.utime(schedule_file, (later, later))
+        if ran or len(sleeps) > 10:
+            raise Stop
+
+    real_sleep = scheduler.time.sleep
+    scheduler.time.sleep = fake_sleep
+    try:
+        sched.run_continuous(check_interval=1)
+    except Stop:
+        pass
+    finally:
+        scheduler.time.sleep = real_sleep
+
+    check(len(sleeps) >= 2, f"Loop kept sleeping with nothing enabled ({len(sleeps)} sleeps)")
+    check(ran == ["digest"], f"Task enabled later was run ({ran})")
+
+
+def test_audit_checksums(tmp: Path):
+    """Test 5: Audit checksums verify whichever JSON library wrote them."""
+    print("\n--- Test 5: Audit Checksums ---")
+    import audit_logger
+    saved = audit_logger.ORJSON_AVAILABLE
+    data = {"amount": 1e16, "big": 2 ** 70, "text": "Sübject"}
+
+    for use_orjson in (True, False):
+        if use_orjson and not saved:
+            log("PASS", "orjson not installed; stdlib path only")
+            continue
+        audit_logger.ORJSON_AVAILABLE = use_orjson
+        vault = tmp / f"audit_{'orjson' if use_orjson else 'json'}"
+        try:
+            logger = audit_logger.AuditLogger(str(vault))
+            logger.log(audit_logger.EventType.TASK_COMPLETED, data)
+            logger.log_error("boom", {"x": 1})
+            result = logger.verify_log_integrity()
+        finally:
+            audit_logger.ORJSON_AVAILABLE = saved
+        label = "orjson" if use_orjson else "json"
+        check(result["invalid"] == 0 and result["valid"] == result["total_events"] > 0,
+              f"{label}-written log verifies ({result['valid']}/{result['total_events']})")
+
+    # Lines written by orjson verify under json, and the other way round
+    event = {"event_id": "EVT_1", "data": data}
+    payload = audit_logger._canonical_json(event)
+    line = payload[:-1] + b',"checksum":"' + audit_logger._checksum(payload).encode('ascii') + b'"}'
+    results = []
+    for use_orjson in (True, False):
+        audit_logger.ORJSON_AVAILABLE = use_orjson and saved
+        try:
+            results.append(audit_logger._verify_line(line))
+        finally:
+            audit_logger.ORJSON_AVAILABLE = saved
+    check(all(results), "Checksum independent of the parser")
+
+
+def test_approval_state_db(tmp: Path):
+    """Test 6: Approved files are remembered across restarts."""
+    print("\n--- Test 6: Approval State Database ---")
+    from approval_workflow import ApprovalWorkflow
+    vault = tmp / "approvals"
+
+    workflow = ApprovalWorkflow(str(vault))
+    request = workflow.pending_folder / "EMAIL_state.md"
+    request.write_text("---\ntype: email\nstatus: pending\n---\n\n## Actions\n\n- [x] **APPROVE**\n")
+    mtime = request.stat().st_mtime_ns
+    first = workflow.check_for_approvals()
+    workflow.close()
+    check(len(first) == 1, f"Approval handled once ({len(first)})")
+
+    # Same name and mtime reappearing in Pending_Approval is not handled again
+    request.write_text("---\ntype: email\nstatus: pending\n---\n\n## Actions\n\n- [x] **APPROVE**\n")
+    os.utime(request, ns=(mtime, mtime))
+    workflow = ApprovalWorkflow(str(vault))
+    try:
+        check(workflow._is_processed("EMAIL_state.md", mtime), "Processed row survives a restart")
+        check(workflow.check_for_approvals() == [], "Already-handled file skipped")
+        check(not workflow._is_processed("EMAIL_state.md", mtime + 1), "Changed file is not skipped")
+    finally:
+        workflow.close()
+
+
+def test_poison_queue_items(tmp: Path):
+    """Test 7: Queue items that can't be processed move to Failed, not back to the front."""
+    print("\n--- Test 7: Poison Queue Items ---")
+    from approval_executor import ApprovalExecutor
+    vault = tmp / "poison"
+    vault.mkdir()
+    executor = ApprovalExecutor(str(vault))
+
+    (executor.queue_path / "execute_bad.json").write_text("{not json")
+    binary = vault / "EMAIL_binary.md"
+    binary.write_bytes(b"---\ntype: email_reply\n---\n\xff\xfe")
+    (executor.queue_path / "execute_binary.json").write_text(
+        json.dumps({"id": "binary", "sourcePath": str(binary)}))
+    other = vault / "OTHER_ok.md"
+    other.write_text("---\ntype: other\n---\n")
+    (executor.queue_path / "execute_ok.json").write_text(json.dumps({"id": "ok", "sourcePath": str(other)}))
+
+    try:
+        first = executor.check_queue()
+        second = executor.check_queue()
+    finally:
+        executor.close()
+
+    check(first == 3, f"All three items handled ({first})")
+    check(second == 0, f"Nothing handled on the next check ({second})")
+    failed = sorted(p.name for p in executor.failed_path.iterdir())
+    check(failed == ["execute_bad.json", "execute_binary.json"], f"Poison items moved to Failed ({failed})")
+    check(not list(executor.queue_path.glob("execute_*.json")), "Queue is empty")
+
+
+def main():
+    global PASS, FAIL
+
+    print("=" * 60)
+    print("AI Employee - Performance Path Tests")
+    print("=" * 60)
+
+    if not VAULT.exists():
+        print(f"ERROR: Vault not found at {VAULT}")
+        sys.exit(1)
+
+    tmp = Path(tempfile.mkdtemp(prefix="ai_employee_test_"))
+    tests = [
+        test_sendmail_retry,
+        test_send_batch_bad_items,
+        test_crlf_draft,
+        test_empty_schedule_loop,
+        test_audit_checksums,
+        test_approval_state_db,
+        test_poison_queue_items,
+    ]
+    try:
+        for test in tests:
+            try:
+                test(tmp)
+            except Exception as e:
+                log("FAIL", f"{test.__name__} raised {type(e).__name__}: {e}")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    # Summary
+    total = PASS + FAIL
+    print("\n" + "=" * 60)
+    print(f"RESULTS: {PASS}/{total} passed, {FAIL} failed")
+    print("=" * 60)
+
+    sys.exit(0 if FAIL == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()